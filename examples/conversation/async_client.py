@@ -8,6 +8,8 @@ including concurrent operations with asyncio.gather.
 import asyncio
 import os
 import sys
+from functools import lru_cache
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -20,9 +22,15 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 async def main():
     # Load shared .env from the examples directory
-    load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+    _load_examples_env()
 
     service_id = os.environ.get("AMIGO_SERVICE_ID")
     if not service_id:
@@ -79,4 +87,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        # Optional: uvloop is a drop-in, faster event loop (pip install uvloop)
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -1,5 +1,5 @@
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -15,30 +15,36 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 def make_event_logger(label: str):
     new_message_count = 0
     printed_ellipsis = False
 
-    def _log(event: dict) -> None:
+    def _log(evt) -> None:
         nonlocal new_message_count, printed_ellipsis
-        event_type = event.get("type")
+        # Serialize straight to JSON; model_dump_json avoids the intermediate dict
+        event_type = getattr(evt.root, "type", None)
         if event_type == "new-message":
             if new_message_count < 3:
                 new_message_count += 1
-                print(f"[{label} event] {json.dumps(event, indent=2)}")
+                print(f"[{label} event] {evt.model_dump_json(indent=2)}")
             elif not printed_ellipsis:
                 printed_ellipsis = True
                 print(f"[{label} event] ... (more new-message events)")
             return
-        print(f"[{label} event] {json.dumps(event, indent=2)}")
+        print(f"[{label} event] {evt.model_dump_json(indent=2)}")
 
     return _log
 
 
 def run() -> None:
     # Load env vars from examples/.env (shared by all examples)
-    examples_env = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=examples_env)
+    _load_examples_env()
 
     service_id = os.getenv("AMIGO_SERVICE_ID")
     if not service_id:
@@ -57,11 +63,11 @@ def run() -> None:
             conversation_id: str | None = None
             log_create = make_event_logger("create")
             for evt in create_events:
-                event = evt.model_dump(mode="json")
-                log_create(event)
-                if event.get("type") == "conversation-created":
-                    conversation_id = event.get("conversation_id")
-                if event.get("type") == "interaction-complete":
+                log_create(evt)
+                event_type = getattr(evt.root, "type", None)
+                if event_type == "conversation-created":
+                    conversation_id = evt.root.conversation_id
+                if event_type == "interaction-complete":
                     break
 
             if not conversation_id:
@@ -71,11 +77,7 @@ def run() -> None:
             conversation = client.conversation.get_conversations(
                 GetConversationsParametersQuery(id=[conversation_id])
             )
-            print(
-                json.dumps(
-                    conversation.conversations[0].model_dump(mode="json"), indent=2
-                ),
-            )
+            print(conversation.conversations[0].model_dump_json(indent=2))
 
             print("\nSending a text message to the conversation (sync)...")
             interaction_events = client.conversation.interact_with_conversation(
@@ -87,9 +89,8 @@ def run() -> None:
             )
             log_interact = make_event_logger("interact")
             for evt in interaction_events:
-                event = evt.model_dump(mode="json")
-                log_interact(event)
-                if event.get("type") == "interaction-complete":
+                log_interact(evt)
+                if getattr(evt.root, "type", None) == "interaction-complete":
                     break
 
             print("\nFetching recent messages (sync)...")
@@ -99,8 +100,8 @@ def run() -> None:
                     limit=10, sort_by=["+created_at"]
                 ),
             )
-            for m in getattr(messages_page, "messages", []) or []:
-                print("[message]", json.dumps(m.model_dump(mode="json"), indent=2))
+            for m in messages_page.messages:
+                print("[message]", m.model_dump_json(indent=2))
 
             print("\nFinishing conversation (sync)...")
             try:
@@ -1,6 +1,6 @@
 import asyncio
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -16,10 +16,15 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 async def run() -> None:
     # Load env vars from examples/.env (shared by all examples)
-    examples_env = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=examples_env)
+    _load_examples_env()
 
     service_id = os.getenv("AMIGO_SERVICE_ID")
     if not service_id:
@@ -41,10 +46,9 @@ async def run() -> None:
             conversation_id: str | None = None
             log_create = make_event_logger("create")
             async for evt in create_events:
-                event = evt.model_dump(mode="json")
-                log_create(event)
-                if event.get("type") == "conversation-created":
-                    conversation_id = event.get("conversation_id")
+                log_create(evt)
+                if getattr(evt.root, "type", None) == "conversation-created":
+                    conversation_id = evt.root.conversation_id
 
             if not conversation_id:
                 raise RuntimeError("Conversation was not created (no id received).")
@@ -54,11 +58,7 @@ async def run() -> None:
             conversation = await client.conversation.get_conversations(
                 GetConversationsParametersQuery(id=[conversation_id])
             )
-            print(
-                json.dumps(
-                    conversation.conversations[0].model_dump(mode="json"), indent=2
-                ),
-            )
+            print(conversation.conversations[0].model_dump_json(indent=2))
 
             # 3) Interact with the conversation via text and log streamed events
             print("\nSending a text message to the conversation...")
@@ -72,30 +72,39 @@ async def run() -> None:
 
             log_interact = make_event_logger("interact")
             async for evt in interaction_events:
-                event = evt.model_dump(mode="json")
-                log_interact(event)
-                if event.get("type") == "interaction-complete":
+                log_interact(evt)
+                if getattr(evt.root, "type", None) == "interaction-complete":
                     break
 
-            # 4) Get messages for the conversation and log them
-            print("\nFetching recent messages...")
-            messages_page = await client.conversation.get_conversation_messages(
-                conversation_id,
-                GetConversationMessagesParametersQuery(
-                    limit=10, sort_by=["+created_at"]
+            # 4) + 5) Fetch recent messages and finish the conversation.
+            # Neither call depends on the other, so let them overlap.
+            print("\nFetching recent messages and finishing conversation...")
+            messages_page, finish_result = await asyncio.gather(
+                client.conversation.get_conversation_messages(
+                    conversation_id,
+                    GetConversationMessagesParametersQuery(
+                        limit=10, sort_by=["+created_at"]
+                    ),
                 ),
+                client.conversation.finish_conversation(conversation_id),
+                return_exceptions=True,
             )
-            for m in getattr(messages_page, "messages", []) or []:
-                print("[message]", json.dumps(m.model_dump(mode="json"), indent=2))
 
-            # 5) Finish the conversation
-            print("\nFinishing conversation...")
-            try:
-                await client.conversation.finish_conversation(conversation_id)
-                print("Conversation finished.")
-            except (ConflictError, NotFoundError) as e:
+            if isinstance(messages_page, BaseException):
+                raise messages_page
+            for m in messages_page.messages:
+                print("[message]", m.model_dump_json(indent=2))
+
+            if isinstance(finish_result, ConflictError | NotFoundError):
                 # Acceptable eventual-consistency outcomes
-                print(f"Finish conversation warning: {type(e).__name__} - {e}")
+                print(
+                    "Finish conversation warning: "
+                    f"{type(finish_result).__name__} - {finish_result}"
+                )
+            elif isinstance(finish_result, BaseException):
+                raise finish_result
+            else:
+                print("Conversation finished.")
 
             print("Done.")
         except AmigoError as err:
@@ -110,21 +119,29 @@ def make_event_logger(label: str):
     new_message_count = 0
     printed_ellipsis = False
 
-    def _log(event: dict) -> None:
+    def _log(evt) -> None:
         nonlocal new_message_count, printed_ellipsis
-        event_type = event.get("type")
+        # Serialize straight to JSON; model_dump_json avoids the intermediate dict
+        event_type = getattr(evt.root, "type", None)
         if event_type == "new-message":
             if new_message_count < 3:
                 new_message_count += 1
-                print(f"[{label} event] {json.dumps(event, indent=2)}")
+                print(f"[{label} event] {evt.model_dump_json(indent=2)}")
             elif not printed_ellipsis:
                 printed_ellipsis = True
                 print(f"[{label} event] ... (more new-message events)")
             return
-        print(f"[{label} event] {json.dumps(event, indent=2)}")
+        print(f"[{label} event] {evt.model_dump_json(indent=2)}")
 
     return _log
 
 
 if __name__ == "__main__":
+    try:
+        # Optional: uvloop is a drop-in, faster event loop (pip install uvloop)
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(run())
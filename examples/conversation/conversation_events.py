@@ -1,5 +1,5 @@
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -20,6 +20,12 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 def handle_conversation_created(event: ConversationCreatedEvent) -> str:
     """Extract and return the conversation id."""
     return event.conversation_id
@@ -46,33 +52,33 @@ def handle_current_agent_action(_event: CurrentAgentActionEvent) -> None:
 
 
 def handle_error(event: ErrorEvent) -> None:
-    print("[error]", json.dumps(event.model_dump(mode="json"), indent=2))
+    print("[error]", event.model_dump_json(indent=2))
 
 
 def make_event_logger(label: str):
     new_message_count = 0
     printed_ellipsis = False
 
-    def _log(event: dict) -> None:
+    def _log(evt) -> None:
         nonlocal new_message_count, printed_ellipsis
-        event_type = event.get("type")
+        # Serialize straight to JSON; model_dump_json avoids the intermediate dict
+        event_type = getattr(evt.root, "type", None)
         if event_type == "new-message":
             if new_message_count < 3:
                 new_message_count += 1
-                print(f"[{label} event] {json.dumps(event, indent=2)}")
+                print(f"[{label} event] {evt.model_dump_json(indent=2)}")
             elif not printed_ellipsis:
                 printed_ellipsis = True
                 print(f"[{label} event] ... (more new-message events)\n")
             return
-        print(f"[{label} event] {json.dumps(event, indent=2)}")
+        print(f"[{label} event] {evt.model_dump_json(indent=2)}")
 
     return _log
 
 
 def run() -> None:
     # Load env vars from examples/.env (shared by all examples)
-    examples_env = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=examples_env)
+    _load_examples_env()
 
     service_id = os.getenv("AMIGO_SERVICE_ID")
     if not service_id:
@@ -92,8 +98,7 @@ def run() -> None:
             conversation_id: str | None = None
             log_create = make_event_logger("create")
             for evt in create_events:
-                event_dict = evt.model_dump(mode="json")
-                log_create(event_dict)
+                log_create(evt)
                 e = evt.root
                 if isinstance(e, ConversationCreatedEvent):
                     conversation_id = handle_conversation_created(e)
@@ -120,8 +125,7 @@ def run() -> None:
             latest_interaction_id: str | None = None
             log_interact = make_event_logger("interact")
             for evt in interaction_events:
-                event_dict = evt.model_dump(mode="json")
-                log_interact(event_dict)
+                log_interact(evt)
                 e = evt.root
                 if isinstance(e, InteractionCompleteEvent):
                     latest_interaction_id, full_response = handle_interaction_complete(
@@ -144,8 +148,8 @@ def run() -> None:
                     limit=10, sort_by=["+created_at"]
                 ),
             )
-            for m in getattr(messages_page, "messages", []) or []:
-                print("[message]", json.dumps(m.model_dump(mode="json"), indent=2))
+            for m in messages_page.messages:
+                print("[message]", m.model_dump_json(indent=2))
 
             print("\nFinishing conversation (sync)...")
             try:
@@ -7,6 +7,8 @@ dispatching on event type to handle partial text, completion, and other events.
 
 import os
 import sys
+from functools import lru_cache
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -18,9 +20,15 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 def main():
     # Load shared .env from the examples directory
-    load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+    _load_examples_env()
 
     service_id = os.environ.get("AMIGO_SERVICE_ID")
     if not service_id:
@@ -5,8 +5,9 @@ Demonstrates how to catch and inspect typed SDK errors,
 including authentication failures, not-found errors, and rate limits.
 """
 
-import os
 import time
+from functools import lru_cache
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -20,9 +21,15 @@ from amigo_sdk.errors import (
 from amigo_sdk.models import GetConversationsParametersQuery
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env")
+
+
 def main():
     # Load shared .env from the examples directory
-    load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
+    _load_examples_env()
 
     # 1. Handling authentication errors
     print("1. Testing authentication error handling...")
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -12,10 +13,15 @@ from amigo_sdk.models import (
 )
 
 
+@lru_cache(maxsize=1)
+def _load_examples_env() -> None:
+    """Load shared env vars from examples/.env once per process."""
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+
 def run() -> None:
     # Load env vars from examples/.env (shared by all examples)
-    examples_env = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=examples_env)
+    _load_examples_env()
 
     created_user_id: str | None = None
     created_user_email: str | None = None
@@ -152,24 +152,31 @@ def main() -> None:
     if aliases_path.exists():
         aliases = json.loads(aliases_path.read_text())
 
-    generate(
-        json.dumps(spec),
-        input_file_type=InputFileType.OpenAPI,
-        output=output_file,
-        output_model_type=DataModelType.PydanticV2BaseModel,
-        openapi_scopes=[
-            OpenAPIScope.Schemas,
-            OpenAPIScope.Parameters,
-            OpenAPIScope.Paths,
-            OpenAPIScope.Tags,
-        ],
-        snake_case_field=True,
-        field_constraints=True,
-        use_operation_id_as_name=True,
-        reuse_model=True,
-        aliases=aliases,
-        collapse_root_models=False,
-    )
+    # Hand generate() a file path instead of one multi-MB Python string so the
+    # generator reads the spec from disk rather than holding a second copy.
+    tmp_spec = out_dir / "_openapi.json"
+    tmp_spec.write_text(json.dumps(spec))
+    try:
+        generate(
+            tmp_spec,
+            input_file_type=InputFileType.OpenAPI,
+            output=output_file,
+            output_model_type=DataModelType.PydanticV2BaseModel,
+            openapi_scopes=[
+                OpenAPIScope.Schemas,
+                OpenAPIScope.Parameters,
+                OpenAPIScope.Paths,
+                OpenAPIScope.Tags,
+            ],
+            snake_case_field=True,
+            field_constraints=True,
+            use_operation_id_as_name=True,
+            reuse_model=True,
+            aliases=aliases,
+            collapse_root_models=False,
+        )
+    finally:
+        tmp_spec.unlink(missing_ok=True)
     apply_output_compat_fixes(output_file)
 
     print(f"Generated models from {spec_path} -> {output_file}")
@@ -31,9 +31,12 @@ def load_document(args: argparse.Namespace) -> dict:
         document = json.loads(spec_path.read_text())
     else:
         print(f"Syncing OpenAPI snapshot from URL: {args.url}")
-        response = httpx.get(args.url, timeout=30.0)
-        response.raise_for_status()
-        document = response.json()
+        # Stream the multi-MB schema and parse the raw bytes; going through
+        # response.text would decode the whole body to one large str first.
+        with httpx.stream("GET", args.url, timeout=30.0) as response:
+            response.raise_for_status()
+            raw = b"".join(response.iter_bytes(1 << 16))
+        document = json.loads(raw)
 
     if not isinstance(document, dict) or not isinstance(document.get("openapi"), str):
         raise ValueError("Invalid OpenAPI document received while syncing snapshot.")
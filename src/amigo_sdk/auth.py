@@ -15,34 +15,76 @@ def _signin_url_headers(cfg: AmigoConfig) -> tuple[str, dict[str, str]]:
     return url, headers
 
 
-def _parse_signin_response_text(
+def _parse_signin_response(
     response: httpx.Response,
 ) -> UserSignInWithApiKeyResponse:
     try:
-        return UserSignInWithApiKeyResponse.model_validate_json(response.text)
+        return UserSignInWithApiKeyResponse.model_validate_json(response.content)
     except Exception as e:
         raise AuthenticationError(f"Invalid response format: {e}") from e
 
 
-def sign_in_with_api_key(cfg: AmigoConfig) -> UserSignInWithApiKeyResponse:
-    """Sign in with API key (sync)."""
+def _drop_stale_bearer(client: httpx.Client | httpx.AsyncClient) -> None:
+    """Remove any client-default Authorization header before signing in.
+
+    The SDK clients install the bearer token as a client-level default, and
+    httpx merges defaults into every request — including this token exchange,
+    which must authenticate with the x-api-key headers alone. Without this an
+    expired (or just-401'd) bearer would ride along on the refresh and could
+    be rejected by auth middleware that gives bearer precedence.
+    """
+    client.headers.pop("Authorization", None)
+
+
+def _post_signin(
+    client: httpx.Client, url: str, headers: dict[str, str]
+) -> UserSignInWithApiKeyResponse:
+    try:
+        _drop_stale_bearer(client)
+        response = client.post(url, headers=headers)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise AuthenticationError(f"Sign in with API key failed: {e}") from e
+    return _parse_signin_response(response)
+
+
+async def _post_signin_async(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str]
+) -> UserSignInWithApiKeyResponse:
+    try:
+        _drop_stale_bearer(client)
+        response = await client.post(url, headers=headers)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise AuthenticationError(f"Sign in with API key failed: {e}") from e
+    return _parse_signin_response(response)
+
+
+def sign_in_with_api_key(
+    cfg: AmigoConfig, client: httpx.Client | None = None
+) -> UserSignInWithApiKeyResponse:
+    """Sign in with API key (sync).
+
+    When `client` is provided its connection pool is reused, avoiding a fresh
+    TCP+TLS handshake for every token exchange.
+    """
     url, headers = _signin_url_headers(cfg)
-    with httpx.Client() as client:
-        try:
-            response = client.post(url, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise AuthenticationError(f"Sign in with API key failed: {e}") from e
-        return _parse_signin_response_text(response)
+    if client is not None:
+        return _post_signin(client, url, headers)
+    with httpx.Client() as own_client:
+        return _post_signin(own_client, url, headers)
+
 
+async def sign_in_with_api_key_async(
+    cfg: AmigoConfig, client: httpx.AsyncClient | None = None
+) -> UserSignInWithApiKeyResponse:
+    """Sign in with API key (async).
 
-async def sign_in_with_api_key_async(cfg: AmigoConfig) -> UserSignInWithApiKeyResponse:
-    """Sign in with API key (async)."""
+    When `client` is provided its connection pool is reused, avoiding a fresh
+    TCP+TLS handshake for every token exchange.
+    """
     url, headers = _signin_url_headers(cfg)
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(url, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise AuthenticationError(f"Sign in with API key failed: {e}") from e
-        return _parse_signin_response_text(response)
+    if client is not None:
+        return await _post_signin_async(client, url, headers)
+    async with httpx.AsyncClient() as own_client:
+        return await _post_signin_async(own_client, url, headers)
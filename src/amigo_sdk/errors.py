@@ -113,29 +113,31 @@ class SDKInternalError(AmigoError):
 
 
 # ---- Status code mapping ----------------------------------------------------
+# Built once at import; error-path dispatch is a single dict probe.
+_STATUS_ERROR_MAP: dict[int, type[AmigoError]] = {
+    400: BadRequestError,
+    401: AuthenticationError,
+    403: ForbiddenError,
+    404: NotFoundError,
+    409: ConflictError,
+    422: ValidationError,
+    429: RateLimitError,
+    500: ServerError,
+    503: ServiceUnavailableError,
+}
+
+
 def get_error_class_for_status_code(status_code: int) -> type[AmigoError]:
     """Map HTTP status codes to appropriate AmigoError classes."""
-    error_map = {
-        400: BadRequestError,
-        401: AuthenticationError,
-        403: ForbiddenError,
-        404: NotFoundError,
-        409: ConflictError,
-        422: ValidationError,
-        429: RateLimitError,
-        500: ServerError,
-        503: ServiceUnavailableError,
-    }
-
+    error_class = _STATUS_ERROR_MAP.get(status_code)
+    if error_class is not None:
+        return error_class
     # Default to appropriate base class for status code ranges
-    if status_code in error_map:
-        return error_map[status_code]
-    elif 400 <= status_code < 500:
+    if 400 <= status_code < 500:
         return BadRequestError
-    elif 500 <= status_code < 600:
+    if 500 <= status_code < 600:
         return ServerError
-    else:
-        return AmigoError
+    return AmigoError
 
 
 def raise_for_status(response, message: str | None = None) -> None:
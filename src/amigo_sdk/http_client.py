@@ -1,14 +1,16 @@
 import asyncio
 import datetime as dt
+import importlib.util
 import random
 import threading
 import time
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import BaseModel
 
 from amigo_sdk.auth import sign_in_with_api_key, sign_in_with_api_key_async
 from amigo_sdk.config import AmigoConfig
@@ -23,6 +25,48 @@ from amigo_sdk.generated.model import UserSignInWithApiKeyResponse
 # Shared helpers and structures
 # -----------------------------
 
+# Chunk size for reading NDJSON stream bodies off the wire
+_STREAM_CHUNK_SIZE = 65536
+
+# Pool sizing defaults: NDJSON streams hold a connection for the lifetime of a
+# conversation turn, so keep a generous pool with long keepalive so short REST
+# calls are not blocked behind in-flight streams.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Negotiate HTTP/2 (multiplexes concurrent streams over one connection) when
+# the optional h2 package is installed; httpx falls back to HTTP/1.1 otherwise.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Header set for JSON bodies serialized via _dump_json_bytes.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dump_params(
+    params: BaseModel | dict[str, Any] | None, **dump_kwargs: Any
+) -> dict[str, Any] | None:
+    """Return query params as a plain dict.
+
+    Accepts either a Pydantic params model (dumped in JSON mode) or an
+    already-dumped dict, so paginated callers can reuse one dict and mutate
+    just the cursor between calls instead of re-dumping the whole model.
+    """
+    if params is None or isinstance(params, dict):
+        return params
+    return params.model_dump(mode="json", exclude_none=True, **dump_kwargs)
+
+
+def _dump_json_bytes(model: BaseModel) -> bytes:
+    """Serialize a Pydantic model to JSON bytes in one pydantic-core pass.
+
+    Skips the intermediate model_dump dict and httpx's json= re-encode;
+    callers pass the result as content= with _JSON_HEADERS.
+    """
+    return model.__pydantic_serializer__.to_json(model, exclude_none=True)
+
 
 @dataclass
 class _RetryConfig:
@@ -82,10 +126,80 @@ class _RetryConfig:
         return random.uniform(0.0, window)
 
 
-def _should_refresh_token(token: UserSignInWithApiKeyResponse | None) -> bool:
-    if not token:
-        return True
-    return dt.datetime.now(dt.UTC) > token.expires_at - dt.timedelta(minutes=5)
+# Refresh tokens this many seconds before their reported expiry.
+_TOKEN_REFRESH_MARGIN_SECONDS = 300.0
+
+_T = TypeVar("_T")
+
+
+class _AsyncSingleFlight:
+    """Coalesce concurrent identical requests; optionally cache results.
+
+    Keys are caller-provided strings. All awaiters of an in-flight key share
+    one round-trip and one parsed result; with ttl > 0 the value is also
+    served from cache for that many seconds after completion. Runs on a
+    single event loop, so no locking is needed around the bookkeeping dicts.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def run(self, key: str, ttl: float, factory) -> Any:
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                return entry[1]
+            del self._cache[key]
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await fut
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await factory()
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # waiters re-raise; mark retrieved for the no-waiter case
+            raise
+        else:
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, value)
+            fut.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+
+class _SyncSingleFlight:
+    """Best-effort TTL cache (sync twin of _AsyncSingleFlight).
+
+    Unlike the async version this does not coalesce concurrent callers: the
+    factory runs outside the lock (holding one shared lock across a blocking
+    HTTP call would serialize unrelated keys too), so threads racing on a
+    cold key may each invoke the factory. With ttl > 0, callers arriving
+    after the first result lands are served from cache.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, ttl: float, factory) -> Any:
+        if ttl > 0:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1]
+        value = factory()
+        if ttl > 0:
+            with self._lock:
+                self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+
+def _single_flight_key(path: str, params: dict[str, Any] | None) -> str:
+    return path if params is None else f"{path}?{sorted(params.items())!r}"
 
 
 async def _raise_status_with_body_async(resp: httpx.Response) -> None:
@@ -136,7 +250,14 @@ class AmigoAsyncHttpClient:
     ) -> None:
         self._cfg = cfg
         self._token: UserSignInWithApiKeyResponse | None = None
+        self._auth_header: str | None = None
+        # Monotonic deadline after which the token must be refreshed;
+        # 0.0 forces the initial sign-in.
+        self._token_deadline = 0.0
         self._token_lock = asyncio.Lock()
+        self._single_flight = _AsyncSingleFlight()
+        httpx_kwargs.setdefault("limits", _DEFAULT_LIMITS)
+        httpx_kwargs.setdefault("http2", _HTTP2_AVAILABLE)
         self._client = httpx.AsyncClient(
             base_url=cfg.base_url,
             **httpx_kwargs,
@@ -156,24 +277,88 @@ class AmigoAsyncHttpClient:
         Uses asyncio.Lock to prevent concurrent token refresh requests.
         """
         async with self._token_lock:
-            if _should_refresh_token(self._token):
+            if self._token is None or time.monotonic() >= self._token_deadline:
                 try:
-                    self._token = await sign_in_with_api_key_async(self._cfg)
+                    # Reuse our pooled client so the token exchange skips the
+                    # per-refresh TCP+TLS handshake.
+                    self._token = await sign_in_with_api_key_async(
+                        self._cfg, self._client
+                    )
                 except Exception as e:
                     raise AuthenticationError(
                         "API-key exchange failed",
                     ) from e
+                self._token_deadline = (
+                    time.monotonic()
+                    + (self._token.expires_at - dt.datetime.now(dt.UTC)).total_seconds()
+                    - _TOKEN_REFRESH_MARGIN_SECONDS
+                )
+            self._auth_header = f"Bearer {self._token.id_token}"
+            # Keep the client-level default header in sync so plain requests
+            # don't need a per-call headers dict at all.
+            self._client.headers["Authorization"] = self._auth_header
+            return self._token.id_token
+
+    async def _invalidate_token(self, failed_header: str | None) -> None:
+        """Drop the cached token, but only if it is still the one that 401'd.
+
+        Concurrent 401s race to invalidate; the first caller wins and the rest
+        find a fresh header already in place, so K parallel failures collapse
+        into a single sign-in instead of K.
+        """
+        async with self._token_lock:
+            if self._auth_header == failed_header:
+                self._token = None
+                self._auth_header = None
+                self._token_deadline = 0.0
+                # Also drop the client-level default so the dead token can't
+                # leak into any request issued before the refresh completes.
+                self._client.headers.pop("Authorization", None)
+
+    async def _ensure_auth_header(self) -> str:
+        """Return the cached "Bearer ..." header value, refreshing if needed.
+
+        Fast path is one attribute read plus one expiry compare; the header
+        string is only rebuilt when the token itself changes.
+        """
+        if self._auth_header is not None and time.monotonic() < self._token_deadline:
+            return self._auth_header
+        await self._ensure_token()
+        assert self._auth_header is not None
+        return self._auth_header
 
-        assert self._token is not None
-        return self._token.id_token
+    async def cached_get(
+        self,
+        path: str,
+        *,
+        parse: Callable[[httpx.Response], _T],
+        ttl: float = 0.0,
+        params: dict[str, Any] | None = None,
+    ) -> _T:
+        """GET with single-flight coalescing and an optional TTL cache.
+
+        For idempotent, read-heavy endpoints whose callers may fire the same
+        request concurrently (e.g. at app startup): all callers of an
+        in-flight request share one round-trip and one parsed result, and a
+        ttl > 0 additionally serves the result from cache for that long.
+        """
+
+        async def _fetch() -> _T:
+            resp = await self.request("GET", path, params=params)
+            return parse(resp)
+
+        return await self._single_flight.run(
+            _single_flight_key(path, params), ttl, _fetch
+        )
 
     async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
         """Send an HTTP request with automatic auth and retry handling."""
-        kwargs.setdefault("headers", {})
         attempt = 1
 
         while True:
-            kwargs["headers"]["Authorization"] = f"Bearer {await self._ensure_token()}"
+            # Authorization rides on the client's default headers; this only
+            # refreshes the token (and that header) when it is near expiry.
+            auth_header = await self._ensure_auth_header()
 
             resp: httpx.Response | None = None
             try:
@@ -181,10 +366,8 @@ class AmigoAsyncHttpClient:
 
                 # On 401 refresh token once and retry immediately
                 if resp.status_code == 401:
-                    self._token = None
-                    kwargs["headers"]["Authorization"] = (
-                        f"Bearer {await self._ensure_token()}"
-                    )
+                    await self._invalidate_token(auth_header)
+                    await self._ensure_auth_header()
                     resp = await self._client.request(method, path, **kwargs)
 
             except (httpx.TimeoutException, httpx.TransportError):
@@ -211,57 +394,85 @@ class AmigoAsyncHttpClient:
             raise_for_status(resp)
             return resp
 
-    async def stream_lines(
+    async def stream_line_bytes(
         self,
         method: str,
         path: str,
         abort_event: asyncio.Event | None = None,
         **kwargs,
-    ) -> AsyncIterator[str]:
-        """Stream response lines without buffering the full body.
+    ) -> AsyncIterator[bytes]:
+        """Stream raw NDJSON lines as bytes without buffering the full body.
 
         - Adds Authorization and sensible streaming headers
         - Retries once on 401 by refreshing the token
         - Raises mapped errors for non-2xx without consuming the body
+
+        Yielding bytes lets callers hand lines straight to pydantic-core's
+        model_validate_json without a UTF-8 decode/encode round-trip.
         """
         kwargs.setdefault("headers", {})
         headers = kwargs["headers"]
-        headers["Authorization"] = f"Bearer {await self._ensure_token()}"
+        headers["Authorization"] = await self._ensure_auth_header()
         headers.setdefault("Accept", "application/x-ndjson")
         # Use a long read timeout for streaming — agent responses can take 60+ seconds
         kwargs.setdefault(
             "timeout", httpx.Timeout(connect=10.0, read=300.0, write=10.0, pool=10.0)
         )
 
-        async def _yield_from_response(resp: httpx.Response) -> AsyncIterator[str]:
+        async def _yield_from_response(resp: httpx.Response) -> AsyncIterator[bytes]:
             await _raise_status_with_body_async(resp)
-            if abort_event and abort_event.is_set():
+            # Pre-bind the abort check so the per-chunk loop avoids a
+            # truthiness test plus attribute lookup per iteration.
+            is_set = abort_event.is_set if abort_event else None
+            if is_set and is_set():
                 return
-            async for line in resp.aiter_lines():
-                if abort_event and abort_event.is_set():
+            # Split NDJSON on raw bytes; aiter_lines would decode and scan for
+            # universal newlines in Python on every chunk.
+            buf = bytearray()
+            async for chunk in resp.aiter_bytes(_STREAM_CHUNK_SIZE):
+                if is_set and is_set():
                     return
-                line_stripped = line.strip()
-                if not line_stripped:
+                buf += chunk
+                while (idx := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:idx])
+                    del buf[: idx + 1]
+                    # Fast path: a well-formed JSON object line needs no strip
+                    if line and line[0] == 0x7B and line[-1] == 0x7D:
+                        yield line
+                        continue
+                    line = line.strip()
+                    if line:
+                        yield line
+            tail = bytes(buf).strip()
+            if tail:
+                yield tail
+
+        # One stream context per attempt; a 401 on the first attempt refreshes
+        # the token in place and retries once.
+        for attempt in (0, 1):
+            if abort_event and abort_event.is_set():
+                return
+            async with self._client.stream(method, path, **kwargs) as resp:
+                if resp.status_code == 401 and attempt == 0:
+                    await self._invalidate_token(headers["Authorization"])
+                    headers["Authorization"] = await self._ensure_auth_header()
                     continue
-                yield line_stripped
-
-        # First attempt
-        if abort_event and abort_event.is_set():
-            return
-        async with self._client.stream(method, path, **kwargs) as resp:
-            if resp.status_code == 401:
-                # Refresh token and retry once
-                self._token = None
-                headers["Authorization"] = f"Bearer {await self._ensure_token()}"
-                if abort_event and abort_event.is_set():
-                    return
-                async with self._client.stream(method, path, **kwargs) as retry_resp:
-                    async for ln in _yield_from_response(retry_resp):
-                        yield ln
+                async for ln in _yield_from_response(resp):
+                    yield ln
                 return
 
-            async for ln in _yield_from_response(resp):
-                yield ln
+    async def stream_lines(
+        self,
+        method: str,
+        path: str,
+        abort_event: asyncio.Event | None = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream response lines decoded to str (see stream_line_bytes)."""
+        async for raw in self.stream_line_bytes(
+            method, path, abort_event=abort_event, **kwargs
+        ):
+            yield raw.decode("utf-8")
 
     async def aclose(self) -> None:
         """Close the underlying httpx client."""
@@ -291,7 +502,14 @@ class AmigoHttpClient:
     ) -> None:
         self._cfg = cfg
         self._token: UserSignInWithApiKeyResponse | None = None
+        self._auth_header: str | None = None
+        # Monotonic deadline after which the token must be refreshed;
+        # 0.0 forces the initial sign-in.
+        self._token_deadline = 0.0
         self._token_lock = threading.Lock()
+        self._single_flight = _SyncSingleFlight()
+        httpx_kwargs.setdefault("limits", _DEFAULT_LIMITS)
+        httpx_kwargs.setdefault("http2", _HTTP2_AVAILABLE)
         self._client = httpx.Client(base_url=cfg.base_url, **httpx_kwargs)
         # Retry configuration
         self._retry_cfg = _RetryConfig(
@@ -308,30 +526,88 @@ class AmigoHttpClient:
         Uses threading.Lock to prevent concurrent token refresh requests.
         """
         with self._token_lock:
-            if _should_refresh_token(self._token):
+            if self._token is None or time.monotonic() >= self._token_deadline:
                 try:
-                    self._token = sign_in_with_api_key(self._cfg)
+                    # Reuse our pooled client so the token exchange skips the
+                    # per-refresh TCP+TLS handshake.
+                    self._token = sign_in_with_api_key(self._cfg, self._client)
                 except Exception as e:
                     raise AuthenticationError("API-key exchange failed") from e
-        assert self._token is not None
-        return self._token.id_token
+                self._token_deadline = (
+                    time.monotonic()
+                    + (self._token.expires_at - dt.datetime.now(dt.UTC)).total_seconds()
+                    - _TOKEN_REFRESH_MARGIN_SECONDS
+                )
+            self._auth_header = f"Bearer {self._token.id_token}"
+            # Keep the client-level default header in sync so plain requests
+            # don't need a per-call headers dict at all.
+            self._client.headers["Authorization"] = self._auth_header
+            return self._token.id_token
+
+    def _invalidate_token(self, failed_header: str | None) -> None:
+        """Drop the cached token, but only if it is still the one that 401'd.
+
+        Concurrent 401s race to invalidate; the first caller wins and the rest
+        find a fresh header already in place, so K parallel failures collapse
+        into a single sign-in instead of K.
+        """
+        with self._token_lock:
+            if self._auth_header == failed_header:
+                self._token = None
+                self._auth_header = None
+                self._token_deadline = 0.0
+                # Also drop the client-level default so the dead token can't
+                # leak into any request issued before the refresh completes.
+                self._client.headers.pop("Authorization", None)
+
+    def _ensure_auth_header(self) -> str:
+        """Return the cached "Bearer ..." header value, refreshing if needed.
+
+        Fast path is one attribute read plus one expiry compare; the header
+        string is only rebuilt when the token itself changes.
+        """
+        if self._auth_header is not None and time.monotonic() < self._token_deadline:
+            return self._auth_header
+        self._ensure_token()
+        assert self._auth_header is not None
+        return self._auth_header
+
+    def cached_get(
+        self,
+        path: str,
+        *,
+        parse: Callable[[httpx.Response], _T],
+        ttl: float = 0.0,
+        params: dict[str, Any] | None = None,
+    ) -> _T:
+        """GET with an optional TTL cache (see the async client's cached_get).
+
+        The sync variant does not coalesce truly concurrent callers: threads
+        racing on a cold key may each issue the GET; once a result lands,
+        later callers within the TTL read from cache.
+        """
+
+        def _fetch() -> _T:
+            resp = self.request("GET", path, params=params)
+            return parse(resp)
+
+        return self._single_flight.run(_single_flight_key(path, params), ttl, _fetch)
 
     def request(self, method: str, path: str, **kwargs) -> httpx.Response:
         """Send an HTTP request with automatic auth and retry handling."""
-        kwargs.setdefault("headers", {})
         attempt = 1
 
         while True:
-            kwargs["headers"]["Authorization"] = f"Bearer {self._ensure_token()}"
+            # Authorization rides on the client's default headers; this only
+            # refreshes the token (and that header) when it is near expiry.
+            auth_header = self._ensure_auth_header()
 
             resp: httpx.Response | None = None
             try:
                 resp = self._client.request(method, path, **kwargs)
                 if resp.status_code == 401:
-                    self._token = None
-                    kwargs["headers"]["Authorization"] = (
-                        f"Bearer {self._ensure_token()}"
-                    )
+                    self._invalidate_token(auth_header)
+                    self._ensure_auth_header()
                     resp = self._client.request(method, path, **kwargs)
 
             except (httpx.TimeoutException, httpx.TransportError):
@@ -354,50 +630,80 @@ class AmigoHttpClient:
             raise_for_status(resp)
             return resp
 
-    def stream_lines(
+    def stream_line_bytes(
         self,
         method: str,
         path: str,
         abort_event: threading.Event | None = None,
         **kwargs,
-    ) -> Iterator[str]:
-        """Stream response lines with automatic auth and abort support."""
+    ) -> Iterator[bytes]:
+        """Stream raw NDJSON lines as bytes with automatic auth and abort support.
+
+        Yielding bytes lets callers hand lines straight to pydantic-core's
+        model_validate_json without a UTF-8 decode/encode round-trip.
+        """
         kwargs.setdefault("headers", {})
         headers = kwargs["headers"]
-        headers["Authorization"] = f"Bearer {self._ensure_token()}"
+        headers["Authorization"] = self._ensure_auth_header()
         headers.setdefault("Accept", "application/x-ndjson")
         # Use a long read timeout for streaming — agent responses can take 60+ seconds
         kwargs.setdefault(
             "timeout", httpx.Timeout(connect=10.0, read=300.0, write=10.0, pool=10.0)
         )
 
-        def _yield_from_response(resp: httpx.Response) -> Iterator[str]:
+        def _yield_from_response(resp: httpx.Response) -> Iterator[bytes]:
             _raise_status_with_body_sync(resp)
-            if abort_event and abort_event.is_set():
+            # Pre-bind the abort check so the per-chunk loop avoids a
+            # truthiness test plus attribute lookup per iteration.
+            is_set = abort_event.is_set if abort_event else None
+            if is_set and is_set():
                 return
-            for line in resp.iter_lines():
-                if abort_event and abort_event.is_set():
+            # Split NDJSON on raw bytes; iter_lines would decode and scan for
+            # universal newlines in Python on every chunk.
+            buf = bytearray()
+            for chunk in resp.iter_bytes(_STREAM_CHUNK_SIZE):
+                if is_set and is_set():
                     return
-                line_stripped = (line or "").strip()
-                if not line_stripped:
+                buf += chunk
+                while (idx := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:idx])
+                    del buf[: idx + 1]
+                    # Fast path: a well-formed JSON object line needs no strip
+                    if line and line[0] == 0x7B and line[-1] == 0x7D:
+                        yield line
+                        continue
+                    line = line.strip()
+                    if line:
+                        yield line
+            tail = bytes(buf).strip()
+            if tail:
+                yield tail
+
+        # One stream context per attempt; a 401 on the first attempt refreshes
+        # the token in place and retries once.
+        for attempt in (0, 1):
+            if abort_event and abort_event.is_set():
+                return
+            with self._client.stream(method, path, **kwargs) as resp:
+                if resp.status_code == 401 and attempt == 0:
+                    self._invalidate_token(headers["Authorization"])
+                    headers["Authorization"] = self._ensure_auth_header()
                     continue
-                yield line_stripped
-
-        if abort_event and abort_event.is_set():
-            return
-        with self._client.stream(method, path, **kwargs) as resp:
-            if resp.status_code == 401:
-                self._token = None
-                headers["Authorization"] = f"Bearer {self._ensure_token()}"
-                if abort_event and abort_event.is_set():
-                    return
-                with self._client.stream(method, path, **kwargs) as retry_resp:
-                    for ln in _yield_from_response(retry_resp):
-                        yield ln
+                yield from _yield_from_response(resp)
                 return
 
-            for ln in _yield_from_response(resp):
-                yield ln
+    def stream_lines(
+        self,
+        method: str,
+        path: str,
+        abort_event: threading.Event | None = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Stream response lines decoded to str (see stream_line_bytes)."""
+        for raw in self.stream_line_bytes(
+            method, path, abort_event=abort_event, **kwargs
+        ):
+            yield raw.decode("utf-8")
 
     def close(self) -> None:
         """Close the underlying httpx client."""
@@ -1,3 +1,5 @@
+from typing import Any
+
 from amigo_sdk.generated.model import (
     CreateAgentVersionParametersQuery,
     GetAgentsParametersQuery,
@@ -10,7 +12,13 @@ from amigo_sdk.generated.model import (
     OrganizationGetAgentVersionsResponse,
     Version1,
 )
-from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
+from amigo_sdk.http_client import (
+    _JSON_HEADERS,
+    AmigoAsyncHttpClient,
+    AmigoHttpClient,
+    _dump_json_bytes,
+    _dump_params,
+)
 
 
 class AsyncAgentResource:
@@ -19,6 +27,8 @@ class AsyncAgentResource:
     def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     async def create_agent(
         self, body: OrganizationCreateAgentRequest
@@ -26,29 +36,33 @@ class AsyncAgentResource:
         """Create a new agent in the organization."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/agent",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/agent",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return OrganizationCreateAgentResponse.model_validate_json(response.text)
+        return OrganizationCreateAgentResponse.model_validate_json(response.content)
 
     async def get_agents(
-        self, params: GetAgentsParametersQuery | None = None
+        self, params: GetAgentsParametersQuery | dict[str, Any] | None = None
     ) -> OrganizationGetAgentsResponse:
-        """Get a list of agents in the organization."""
-        response = await self._http.request(
-            "GET",
-            f"/v1/{self._organization_id}/organization/agent",
-            params=params.model_dump(mode="json", exclude_none=True)
-            if params
-            else None,
+        """Get a list of agents in the organization.
+
+        Concurrent identical calls are coalesced into one request. `params`
+        may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
+        return await self._http.cached_get(
+            f"{self._base}/organization/agent",
+            parse=lambda r: OrganizationGetAgentsResponse.model_validate_json(
+                r.content
+            ),
+            params=_dump_params(params),
         )
-        return OrganizationGetAgentsResponse.model_validate_json(response.text)
 
     async def delete_agent(self, agent_id: str) -> None:
         """Delete an agent by ID. Returns None on success (e.g., 204)."""
         await self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/",
+            f"{self._base}/organization/agent/{agent_id}/",
         )
 
     async def create_agent_version(
@@ -64,24 +78,29 @@ class AsyncAgentResource:
             params = query.model_dump(mode="json", exclude_none=True)
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/agent/{agent_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
             params=params,
         )
-        return OrganizationCreateAgentVersionResponse.model_validate_json(response.text)
+        return OrganizationCreateAgentVersionResponse.model_validate_json(
+            response.content
+        )
 
     async def get_agent_versions(
-        self, agent_id: str, params: GetAgentVersionsParametersQuery | None = None
+        self,
+        agent_id: str,
+        params: GetAgentVersionsParametersQuery | dict[str, Any] | None = None,
     ) -> OrganizationGetAgentVersionsResponse:
         """Get versions for a specific agent."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/version",
-            params=params.model_dump(mode="json", exclude_none=True)
-            if params
-            else None,
+            f"{self._base}/organization/agent/{agent_id}/version",
+            params=_dump_params(params),
+        )
+        return OrganizationGetAgentVersionsResponse.model_validate_json(
+            response.content
         )
-        return OrganizationGetAgentVersionsResponse.model_validate_json(response.text)
 
     # --- Convenience aliases ---
 
@@ -108,6 +127,8 @@ class AgentResource:
     def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     def create_agent(
         self, body: OrganizationCreateAgentRequest
@@ -115,29 +136,31 @@ class AgentResource:
         """Create a new agent in the organization."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/agent",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/agent",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return OrganizationCreateAgentResponse.model_validate_json(response.text)
+        return OrganizationCreateAgentResponse.model_validate_json(response.content)
 
     def get_agents(
-        self, params: GetAgentsParametersQuery | None = None
+        self, params: GetAgentsParametersQuery | dict[str, Any] | None = None
     ) -> OrganizationGetAgentsResponse:
-        """Get a list of agents in the organization."""
+        """Get a list of agents in the organization.
+
+        `params` may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/agent",
-            params=params.model_dump(mode="json", exclude_none=True)
-            if params
-            else None,
+            f"{self._base}/organization/agent",
+            params=_dump_params(params),
         )
-        return OrganizationGetAgentsResponse.model_validate_json(response.text)
+        return OrganizationGetAgentsResponse.model_validate_json(response.content)
 
     def delete_agent(self, agent_id: str) -> None:
         """Delete an agent by ID."""
         self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/",
+            f"{self._base}/organization/agent/{agent_id}/",
         )
 
     def create_agent_version(
@@ -153,24 +176,29 @@ class AgentResource:
             params = query.model_dump(mode="json", exclude_none=True)
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/agent/{agent_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
             params=params,
         )
-        return OrganizationCreateAgentVersionResponse.model_validate_json(response.text)
+        return OrganizationCreateAgentVersionResponse.model_validate_json(
+            response.content
+        )
 
     def get_agent_versions(
-        self, agent_id: str, params: GetAgentVersionsParametersQuery | None = None
+        self,
+        agent_id: str,
+        params: GetAgentVersionsParametersQuery | dict[str, Any] | None = None,
     ) -> OrganizationGetAgentVersionsResponse:
         """Get versions for a specific agent."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/agent/{agent_id}/version",
-            params=params.model_dump(mode="json", exclude_none=True)
-            if params
-            else None,
+            f"{self._base}/organization/agent/{agent_id}/version",
+            params=_dump_params(params),
+        )
+        return OrganizationGetAgentVersionsResponse.model_validate_json(
+            response.content
         )
-        return OrganizationGetAgentVersionsResponse.model_validate_json(response.text)
 
     # --- Convenience aliases ---
 
@@ -9,7 +9,12 @@ from amigo_sdk.generated.model import (
     OrganizationGetServiceHierarchicalStateMachinesResponse,
     OrganizationGetServiceHierarchicalStateMachineVersionsResponse,
 )
-from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
+from amigo_sdk.http_client import (
+    _JSON_HEADERS,
+    AmigoAsyncHttpClient,
+    AmigoHttpClient,
+    _dump_json_bytes,
+)
 
 
 class AsyncContextGraphResource:
@@ -18,6 +23,8 @@ class AsyncContextGraphResource:
     def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     async def create_context_graph(
         self, body: OrganizationCreateServiceHierarchicalStateMachineRequest
@@ -25,11 +32,12 @@ class AsyncContextGraphResource:
         """Create a new context graph."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/service_hierarchical_state_machine",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
         return OrganizationCreateServiceHierarchicalStateMachineResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     async def get_context_graphs(
@@ -39,14 +47,14 @@ class AsyncContextGraphResource:
         """List context graphs for the organization."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine",
+            f"{self._base}/organization/service_hierarchical_state_machine",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return (
             OrganizationGetServiceHierarchicalStateMachinesResponse.model_validate_json(
-                response.text
+                response.content
             )
         )
 
@@ -60,21 +68,22 @@ class AsyncContextGraphResource:
         """Create a new version of a context graph."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return OrganizationCreateServiceHierarchicalStateMachineVersionResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     async def delete_context_graph(self, context_graph_id: str) -> None:
         """Delete a context graph."""
         await self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/",
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/",
         )
 
     async def get_context_graph_versions(
@@ -85,13 +94,13 @@ class AsyncContextGraphResource:
         """Get versions of a context graph."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/version",
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/version",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return OrganizationGetServiceHierarchicalStateMachineVersionsResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     # --- Convenience aliases ---
@@ -120,6 +129,8 @@ class ContextGraphResource:
     def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     def create_context_graph(
         self, body: OrganizationCreateServiceHierarchicalStateMachineRequest
@@ -127,11 +138,12 @@ class ContextGraphResource:
         """Create a new context graph."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/service_hierarchical_state_machine",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
         return OrganizationCreateServiceHierarchicalStateMachineResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     def get_context_graphs(
@@ -141,14 +153,14 @@ class ContextGraphResource:
         """List context graphs for the organization."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine",
+            f"{self._base}/organization/service_hierarchical_state_machine",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return (
             OrganizationGetServiceHierarchicalStateMachinesResponse.model_validate_json(
-                response.text
+                response.content
             )
         )
 
@@ -162,21 +174,22 @@ class ContextGraphResource:
         """Create a new version of a context graph."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return OrganizationCreateServiceHierarchicalStateMachineVersionResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     def delete_context_graph(self, context_graph_id: str) -> None:
         """Delete a context graph."""
         self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/",
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/",
         )
 
     def get_context_graph_versions(
@@ -187,13 +200,13 @@ class ContextGraphResource:
         """Get versions of a context graph."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/organization/service_hierarchical_state_machine/{context_graph_id}/version",
+            f"{self._base}/organization/service_hierarchical_state_machine/{context_graph_id}/version",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
         return OrganizationGetServiceHierarchicalStateMachineVersionsResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     # --- Convenience aliases ---
@@ -3,13 +3,14 @@ import json
 import threading
 from collections.abc import AsyncGenerator, Iterator
 from datetime import datetime
-from typing import Literal, TypedDict
+from typing import Any, Literal, TypedDict
 
-from pydantic import AnyUrl, BaseModel
+from pydantic import AnyUrl, BaseModel, ConfigDict
 
 from amigo_sdk.generated.model import (
     ConversationCreateConversationRequest,
     ConversationCreateConversationResponse,
+    ConversationCreatedEvent,
     ConversationEvent,
     ConversationGenerateConversationStarterRequest,
     ConversationGenerateConversationStarterResponse,
@@ -19,12 +20,23 @@ from amigo_sdk.generated.model import (
     ConversationInteractWithConversationResponse,
     ConversationRecommendResponsesForInteractionResponse,
     CreateConversationParametersQuery,
+    ErrorEvent,
     Format,
     GetConversationMessagesParametersQuery,
     GetConversationsParametersQuery,
+    InteractionCompleteEvent,
     InteractWithConversationParametersQuery,
+    NewMessageEvent,
+    TranscriptAlignmentItem,
+    UserMessageAvailableEvent,
+)
+from amigo_sdk.http_client import (
+    _JSON_HEADERS,
+    AmigoAsyncHttpClient,
+    AmigoHttpClient,
+    _dump_json_bytes,
+    _dump_params,
 )
-from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 
 
 class InteractionInput(TypedDict, total=False):
@@ -50,11 +62,82 @@ class _StreamRequestKwargs(TypedDict, total=False):
 class GetMessageSourceResponse(BaseModel):
     """Response model for the get_message_source endpoint."""
 
+    # Server-authored payload: ignore unknown fields instead of storing them,
+    # and freeze instances so construction can skip mutability bookkeeping.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: AnyUrl
     expires_at: datetime
     content_type: Literal["audio/mpeg", "audio/wav"]
 
 
+def _event_type_map(
+    *event_models: type[BaseModel],
+) -> dict[str, type[BaseModel]]:
+    """Map `type` discriminator values to event classes for trusted-mode dispatch."""
+    return {model.model_fields["type"].default: model for model in event_models}
+
+
+# CurrentAgentActionEvent is deliberately absent from both maps: its `action`
+# field is a union of RootModel unions, which model_construct (shallow) would
+# leave as a raw dict. Those events are rare, so they take the full-validation
+# fallback below and keep their typed nested models.
+_CREATE_EVENT_MODELS = _event_type_map(
+    ConversationCreatedEvent,
+    NewMessageEvent,
+    InteractionCompleteEvent,
+    ErrorEvent,
+)
+
+_INTERACT_EVENT_MODELS = _event_type_map(
+    InteractionCompleteEvent,
+    NewMessageEvent,
+    UserMessageAvailableEvent,
+    ErrorEvent,
+)
+
+
+def _construct_new_message_event(data: dict[str, Any]) -> NewMessageEvent:
+    """model_construct a NewMessageEvent including its nested alignment items.
+
+    model_construct is shallow, so the typed list[TranscriptAlignmentItem]
+    field has to be built explicitly or trusted mode would hand callers raw
+    lists where the annotation promises models.
+    """
+    alignment = data.get("transcript_alignment")
+    if alignment is not None:
+        data["transcript_alignment"] = [
+            TranscriptAlignmentItem.model_construct(root=(item[0], item[1]))
+            for item in alignment
+        ]
+    return NewMessageEvent.model_construct(**data)
+
+
+def _construct_trusted_event(
+    container: type[ConversationCreateConversationResponse]
+    | type[ConversationInteractWithConversationResponse],
+    type_map: dict[str, type[BaseModel]],
+    line: bytes,
+):
+    """Build a streamed event without re-running Pydantic validation.
+
+    Dispatches on the `type` discriminator and `model_construct`s the concrete
+    event class, skipping the per-event validator chain. Nested fields are
+    constructed too (see _construct_new_message_event), so trusted events keep
+    the same shape as validated ones. Event types outside the map — unknown
+    ones, and deeply nested ones like `current-agent-action` — fall back to
+    full validation so schema drift still surfaces as a clear validation
+    error.
+    """
+    data = json.loads(line)
+    event_cls = type_map.get(data.get("type")) if isinstance(data, dict) else None
+    if event_cls is None:
+        return container.model_validate_json(line)
+    if event_cls is NewMessageEvent:
+        return container.model_construct(root=_construct_new_message_event(data))
+    return container.model_construct(root=event_cls.model_construct(**data))
+
+
 def _build_interact_form_data(
     *,
     initial_message_type: Literal["user-message", "external-event"],
@@ -75,9 +158,30 @@ def _build_interact_form_data(
 class AsyncConversationResource:
     """Conversation resource for Amigo API operations."""
 
-    def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
+    def __init__(
+        self,
+        http_client: AmigoAsyncHttpClient,
+        organization_id: str,
+        *,
+        trust_server: bool = False,
+    ) -> None:
+        """Initialize the resource.
+
+        Args:
+            http_client: Shared HTTP client.
+            organization_id: Organization the resource is scoped to.
+            trust_server: When True, streamed NDJSON events are built with
+                `model_construct` instead of full validation; nested fields
+                keep their typed models, and deeply nested event types
+                (current-agent-action) are still fully validated. Only enable
+                this for responses from the Amigo API itself; never for
+                untrusted input.
+        """
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
+        self._trust_server = trust_server
 
     async def create_conversation(
         self,
@@ -91,16 +195,28 @@ class AsyncConversationResource:
         """
 
         async def _generator():
-            async for line in self._http.stream_lines(
+            async for line in self._http.stream_line_bytes(
                 "POST",
-                f"/v1/{self._organization_id}/conversation/",
+                f"{self._base}/conversation/",
                 params=params.model_dump(mode="json", exclude_none=True),
-                json=body.model_dump(mode="json", exclude_none=True),
-                headers={"Accept": "application/x-ndjson"},
+                content=_dump_json_bytes(body),
+                headers={
+                    "Accept": "application/x-ndjson",
+                    "Content-Type": "application/json",
+                },
                 abort_event=abort_event,
             ):
                 # Each line is a JSON object representing a discriminated union event
-                yield ConversationCreateConversationResponse.model_validate_json(line)
+                if self._trust_server:
+                    yield _construct_trusted_event(
+                        ConversationCreateConversationResponse,
+                        _CREATE_EVENT_MODELS,
+                        line,
+                    )
+                else:
+                    yield ConversationCreateConversationResponse.model_validate_json(
+                        line
+                    )
 
         return _generator()
 
@@ -178,14 +294,21 @@ class AsyncConversationResource:
             else:
                 raise ValueError("Unsupported or missing request_format in params")
 
-            async for line in self._http.stream_lines(
+            async for line in self._http.stream_line_bytes(
                 "POST",
-                f"/v1/{self._organization_id}/conversation/{conversation_id}/interact",
+                f"{self._base}/conversation/{conversation_id}/interact",
                 **request_kwargs,
             ):
                 # Each line is a JSON object representing a discriminated union event.
                 # The response wraps events in ConversationEvent RootModel; unwrap
                 # so callers get concrete event types directly.
+                if self._trust_server:
+                    yield _construct_trusted_event(
+                        ConversationInteractWithConversationResponse,
+                        _INTERACT_EVENT_MODELS,
+                        line,
+                    )
+                    continue
                 parsed = (
                     ConversationInteractWithConversationResponse.model_validate_json(
                         line
@@ -202,33 +325,41 @@ class AsyncConversationResource:
         """Finish a conversation."""
         await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/finish/",
+            f"{self._base}/conversation/{conversation_id}/finish/",
         )
 
     async def get_conversations(
-        self, params: GetConversationsParametersQuery
+        self, params: GetConversationsParametersQuery | dict[str, Any]
     ) -> ConversationGetConversationsResponse:
-        """Get conversations."""
+        """Get conversations.
+
+        `params` may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/",
-            params=params.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/conversation/",
+            params=_dump_params(params),
+        )
+        return ConversationGetConversationsResponse.model_validate_json(
+            response.content
         )
-        return ConversationGetConversationsResponse.model_validate_json(response.text)
 
     async def get_conversation_messages(
-        self, conversation_id: str, params: GetConversationMessagesParametersQuery
+        self,
+        conversation_id: str,
+        params: GetConversationMessagesParametersQuery | dict[str, Any],
     ) -> ConversationGetConversationMessagesResponse:
-        """Get conversation messages."""
+        """Get conversation messages.
+
+        `params` may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/messages/",
-            params=params.model_dump(
-                mode="json", exclude_none=True, exclude_defaults=True
-            ),
+            f"{self._base}/conversation/{conversation_id}/messages/",
+            params=_dump_params(params, exclude_defaults=True),
         )
         return ConversationGetConversationMessagesResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     async def recommend_responses_for_interaction(
@@ -237,10 +368,10 @@ class AsyncConversationResource:
         """Recommend responses for an interaction."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/interaction/{interaction_id}/recommend_responses",
+            f"{self._base}/conversation/{conversation_id}/interaction/{interaction_id}/recommend_responses",
         )
         return ConversationRecommendResponsesForInteractionResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     async def get_interaction_insights(
@@ -249,10 +380,10 @@ class AsyncConversationResource:
         """Get insights for an interaction."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/interaction/{interaction_id}/insights",
+            f"{self._base}/conversation/{conversation_id}/interaction/{interaction_id}/insights",
         )
         return ConversationGetInteractionInsightsResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     async def get_message_source(
@@ -261,9 +392,9 @@ class AsyncConversationResource:
         """Get the source of a message."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/messages/{message_id}/source",
+            f"{self._base}/conversation/{conversation_id}/messages/{message_id}/source",
         )
-        return GetMessageSourceResponse.model_validate_json(response.text)
+        return GetMessageSourceResponse.model_validate_json(response.content)
 
     async def generate_conversation_starters(
         self, body: ConversationGenerateConversationStarterRequest
@@ -271,11 +402,12 @@ class AsyncConversationResource:
         """Generate conversation starters."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/conversation_starter",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/conversation/conversation_starter",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
         return ConversationGenerateConversationStarterResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     # --- Convenience aliases ---
@@ -308,9 +440,30 @@ class AsyncConversationResource:
 class ConversationResource:
     """Conversation resource for synchronous operations."""
 
-    def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
+    def __init__(
+        self,
+        http_client: AmigoHttpClient,
+        organization_id: str,
+        *,
+        trust_server: bool = False,
+    ) -> None:
+        """Initialize the resource.
+
+        Args:
+            http_client: Shared HTTP client.
+            organization_id: Organization the resource is scoped to.
+            trust_server: When True, streamed NDJSON events are built with
+                `model_construct` instead of full validation; nested fields
+                keep their typed models, and deeply nested event types
+                (current-agent-action) are still fully validated. Only enable
+                this for responses from the Amigo API itself; never for
+                untrusted input.
+        """
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
+        self._trust_server = trust_server
 
     def create_conversation(
         self,
@@ -321,15 +474,27 @@ class ConversationResource:
         """Create a new conversation and stream NDJSON events."""
 
         def _iter():
-            for line in self._http.stream_lines(
+            for line in self._http.stream_line_bytes(
                 "POST",
-                f"/v1/{self._organization_id}/conversation/",
+                f"{self._base}/conversation/",
                 params=params.model_dump(mode="json", exclude_none=True),
-                json=body.model_dump(mode="json", exclude_none=True),
-                headers={"Accept": "application/x-ndjson"},
+                content=_dump_json_bytes(body),
+                headers={
+                    "Accept": "application/x-ndjson",
+                    "Content-Type": "application/json",
+                },
                 abort_event=abort_event,
             ):
-                yield ConversationCreateConversationResponse.model_validate_json(line)
+                if self._trust_server:
+                    yield _construct_trusted_event(
+                        ConversationCreateConversationResponse,
+                        _CREATE_EVENT_MODELS,
+                        line,
+                    )
+                else:
+                    yield ConversationCreateConversationResponse.model_validate_json(
+                        line
+                    )
 
         return _iter()
 
@@ -405,11 +570,18 @@ class ConversationResource:
             else:
                 raise ValueError("Unsupported or missing request_format in params")
 
-            for line in self._http.stream_lines(
+            for line in self._http.stream_line_bytes(
                 "POST",
-                f"/v1/{self._organization_id}/conversation/{conversation_id}/interact",
+                f"{self._base}/conversation/{conversation_id}/interact",
                 **request_kwargs,
             ):
+                if self._trust_server:
+                    yield _construct_trusted_event(
+                        ConversationInteractWithConversationResponse,
+                        _INTERACT_EVENT_MODELS,
+                        line,
+                    )
+                    continue
                 parsed = (
                     ConversationInteractWithConversationResponse.model_validate_json(
                         line
@@ -426,33 +598,41 @@ class ConversationResource:
         """Finish a conversation."""
         self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/finish/",
+            f"{self._base}/conversation/{conversation_id}/finish/",
         )
 
     def get_conversations(
-        self, params: GetConversationsParametersQuery
+        self, params: GetConversationsParametersQuery | dict[str, Any]
     ) -> ConversationGetConversationsResponse:
-        """Get a list of conversations matching the query parameters."""
+        """Get a list of conversations matching the query parameters.
+
+        `params` may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/",
-            params=params.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/conversation/",
+            params=_dump_params(params),
+        )
+        return ConversationGetConversationsResponse.model_validate_json(
+            response.content
         )
-        return ConversationGetConversationsResponse.model_validate_json(response.text)
 
     def get_conversation_messages(
-        self, conversation_id: str, params: GetConversationMessagesParametersQuery
+        self,
+        conversation_id: str,
+        params: GetConversationMessagesParametersQuery | dict[str, Any],
     ) -> ConversationGetConversationMessagesResponse:
-        """Get messages for a conversation."""
+        """Get messages for a conversation.
+
+        `params` may be a pre-dumped dict for cursor-mutating pagination loops.
+        """
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/messages/",
-            params=params.model_dump(
-                mode="json", exclude_none=True, exclude_defaults=True
-            ),
+            f"{self._base}/conversation/{conversation_id}/messages/",
+            params=_dump_params(params, exclude_defaults=True),
         )
         return ConversationGetConversationMessagesResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     def recommend_responses_for_interaction(
@@ -461,10 +641,10 @@ class ConversationResource:
         """Get recommended responses for an interaction."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/interaction/{interaction_id}/recommend_responses",
+            f"{self._base}/conversation/{conversation_id}/interaction/{interaction_id}/recommend_responses",
         )
         return ConversationRecommendResponsesForInteractionResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     def get_interaction_insights(
@@ -473,10 +653,10 @@ class ConversationResource:
         """Get insights for an interaction."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/interaction/{interaction_id}/insights",
+            f"{self._base}/conversation/{conversation_id}/interaction/{interaction_id}/insights",
         )
         return ConversationGetInteractionInsightsResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     def get_message_source(
@@ -485,9 +665,9 @@ class ConversationResource:
         """Get the audio/media source URL for a message."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/conversation/{conversation_id}/messages/{message_id}/source",
+            f"{self._base}/conversation/{conversation_id}/messages/{message_id}/source",
         )
-        return GetMessageSourceResponse.model_validate_json(response.text)
+        return GetMessageSourceResponse.model_validate_json(response.content)
 
     def generate_conversation_starters(
         self, body: ConversationGenerateConversationStarterRequest
@@ -495,11 +675,12 @@ class ConversationResource:
         """Generate conversation starter suggestions."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/conversation/conversation_starter",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/conversation/conversation_starter",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
         return ConversationGenerateConversationStarterResponse.model_validate_json(
-            response.text
+            response.content
         )
 
     # --- Convenience aliases ---
@@ -3,6 +3,14 @@ from amigo_sdk.generated.model import (
 )
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 
+# Organization details change rarely; serve repeat reads from cache briefly so
+# startup bursts (branding, config checks) collapse into one request.
+_ORG_CACHE_TTL_SECONDS = 30.0
+
+
+def _parse_organization(response) -> OrganizationGetOrganizationResponse:
+    return OrganizationGetOrganizationResponse.model_validate_json(response.content)
+
 
 class AsyncOrganizationResource:
     """Organization resource for Amigo API operations."""
@@ -10,17 +18,22 @@ class AsyncOrganizationResource:
     def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     async def get(self) -> OrganizationGetOrganizationResponse:
         """
         Get the details of an organization.
+
+        Concurrent callers share one request, and the parsed response is
+        cached for a short TTL.
         """
-        response = await self._http.request(
-            "GET", f"/v1/{self._organization_id}/organization/"
+        return await self._http.cached_get(
+            f"{self._base}/organization/",
+            parse=_parse_organization,
+            ttl=_ORG_CACHE_TTL_SECONDS,
         )
 
-        return OrganizationGetOrganizationResponse.model_validate_json(response.text)
-
 
 class OrganizationResource:
     """Organization resource for synchronous operations."""
@@ -28,10 +41,16 @@ class OrganizationResource:
     def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     def get(self) -> OrganizationGetOrganizationResponse:
-        """Get the details of the organization."""
-        response = self._http.request(
-            "GET", f"/v1/{self._organization_id}/organization/"
+        """Get the details of the organization.
+
+        The parsed response is cached for a short TTL.
+        """
+        return self._http.cached_get(
+            f"{self._base}/organization/",
+            parse=_parse_organization,
+            ttl=_ORG_CACHE_TTL_SECONDS,
         )
-        return OrganizationGetOrganizationResponse.model_validate_json(response.text)
@@ -6,7 +6,12 @@ from amigo_sdk.generated.model import (
     ServiceUpdateServiceRequest,
     ServiceUpsertServiceVersionSetRequest,
 )
-from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
+from amigo_sdk.http_client import (
+    _JSON_HEADERS,
+    AmigoAsyncHttpClient,
+    AmigoHttpClient,
+    _dump_json_bytes,
+)
 
 
 class AsyncServiceResource:
@@ -15,6 +20,8 @@ class AsyncServiceResource:
     def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     async def get_services(
         self, params: GetServicesParametersQuery | None = None
@@ -22,12 +29,12 @@ class AsyncServiceResource:
         """List services for the organization."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/service/",
+            f"{self._base}/service/",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
-        return ServiceGetServicesResponse.model_validate_json(response.text)
+        return ServiceGetServicesResponse.model_validate_json(response.content)
 
     async def create_service(
         self, body: ServiceCreateServiceRequest
@@ -35,10 +42,11 @@ class AsyncServiceResource:
         """Create a new service."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/service/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return ServiceCreateServiceResponse.model_validate_json(response.text)
+        return ServiceCreateServiceResponse.model_validate_json(response.content)
 
     async def update_service(
         self, service_id: str, body: ServiceUpdateServiceRequest
@@ -46,8 +54,9 @@ class AsyncServiceResource:
         """Update a service."""
         await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/service/{service_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/{service_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     async def upsert_version_set(
@@ -59,15 +68,16 @@ class AsyncServiceResource:
         """Upsert a service version set."""
         await self._http.request(
             "PUT",
-            f"/v1/{self._organization_id}/service/{service_id}/version_sets/{version_set_name}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/{service_id}/version_sets/{version_set_name}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     async def delete_version_set(self, service_id: str, version_set_name: str) -> None:
         """Delete a service version set."""
         await self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/service/{service_id}/version_sets/{version_set_name}/",
+            f"{self._base}/service/{service_id}/version_sets/{version_set_name}/",
         )
 
     # --- Convenience aliases ---
@@ -91,6 +101,8 @@ class ServiceResource:
     def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     def get_services(
         self, params: GetServicesParametersQuery | None = None
@@ -98,12 +110,12 @@ class ServiceResource:
         """List services for the organization."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/service/",
+            f"{self._base}/service/",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
-        return ServiceGetServicesResponse.model_validate_json(response.text)
+        return ServiceGetServicesResponse.model_validate_json(response.content)
 
     def create_service(
         self, body: ServiceCreateServiceRequest
@@ -111,10 +123,11 @@ class ServiceResource:
         """Create a new service."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/service/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return ServiceCreateServiceResponse.model_validate_json(response.text)
+        return ServiceCreateServiceResponse.model_validate_json(response.content)
 
     def update_service(
         self, service_id: str, body: ServiceUpdateServiceRequest
@@ -122,8 +135,9 @@ class ServiceResource:
         """Update a service."""
         self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/service/{service_id}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/{service_id}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     def upsert_version_set(
@@ -135,15 +149,16 @@ class ServiceResource:
         """Upsert a service version set."""
         self._http.request(
             "PUT",
-            f"/v1/{self._organization_id}/service/{service_id}/version_sets/{version_set_name}/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/service/{service_id}/version_sets/{version_set_name}/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     def delete_version_set(self, service_id: str, version_set_name: str) -> None:
         """Delete a service version set."""
         self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/service/{service_id}/version_sets/{version_set_name}/",
+            f"{self._base}/service/{service_id}/version_sets/{version_set_name}/",
         )
 
     # --- Convenience aliases ---
@@ -6,7 +6,12 @@ from amigo_sdk.generated.model import (
     UserGetUsersResponse,
     UserUpdateUserInfoRequest,
 )
-from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
+from amigo_sdk.http_client import (
+    _JSON_HEADERS,
+    AmigoAsyncHttpClient,
+    AmigoHttpClient,
+    _dump_json_bytes,
+)
 
 
 class AsyncUserResource:
@@ -15,6 +20,8 @@ class AsyncUserResource:
     def __init__(self, http_client: AmigoAsyncHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     async def get_users(
         self, params: GetUsersParametersQuery | None = None
@@ -22,12 +29,12 @@ class AsyncUserResource:
         """Get a list of users in the organization."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/user/",
+            f"{self._base}/user/",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
-        return UserGetUsersResponse.model_validate_json(response.text)
+        return UserGetUsersResponse.model_validate_json(response.content)
 
     async def create_user(
         self, body: UserCreateInvitedUserRequest
@@ -35,33 +42,35 @@ class AsyncUserResource:
         """Create (invite) a new user to the organization."""
         response = await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/user/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/user/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return UserCreateInvitedUserResponse.model_validate_json(response.text)
+        return UserCreateInvitedUserResponse.model_validate_json(response.content)
 
     async def delete_user(self, user_id: str) -> None:
         """Delete a user by ID. Returns None on success (e.g., 204)."""
         await self._http.request(
             "DELETE",
-            f"/v1/{self._organization_id}/user/{user_id}",
+            f"{self._base}/user/{user_id}",
         )
 
     async def update_user(self, user_id: str, body: UserUpdateUserInfoRequest) -> None:
         """Update user information. Returns None on success (e.g., 204)."""
         await self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/user/{user_id}",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/user/{user_id}",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     async def get_user_model(self, user_id: str) -> UserGetUserModelResponse:
         """Get the latest user model for a user."""
         response = await self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/user/{user_id}/user_model",
+            f"{self._base}/user/{user_id}/user_model",
         )
-        return UserGetUserModelResponse.model_validate_json(response.text)
+        return UserGetUserModelResponse.model_validate_json(response.content)
 
     # --- Convenience aliases ---
 
@@ -96,6 +105,8 @@ class UserResource:
     def __init__(self, http_client: AmigoHttpClient, organization_id: str) -> None:
         self._http = http_client
         self._organization_id = organization_id
+        # Stable per-org path prefix, computed once instead of per request
+        self._base = f"/v1/{organization_id}"
 
     def get_users(
         self, params: GetUsersParametersQuery | None = None
@@ -103,12 +114,12 @@ class UserResource:
         """Get a list of users in the organization."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/user/",
+            f"{self._base}/user/",
             params=params.model_dump(mode="json", exclude_none=True)
             if params
             else None,
         )
-        return UserGetUsersResponse.model_validate_json(response.text)
+        return UserGetUsersResponse.model_validate_json(response.content)
 
     def create_user(
         self, body: UserCreateInvitedUserRequest
@@ -116,30 +127,32 @@ class UserResource:
         """Create (invite) a new user to the organization."""
         response = self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/user/",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/user/",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
-        return UserCreateInvitedUserResponse.model_validate_json(response.text)
+        return UserCreateInvitedUserResponse.model_validate_json(response.content)
 
     def delete_user(self, user_id: str) -> None:
         """Delete a user by ID."""
-        self._http.request("DELETE", f"/v1/{self._organization_id}/user/{user_id}")
+        self._http.request("DELETE", f"{self._base}/user/{user_id}")
 
     def update_user(self, user_id: str, body: UserUpdateUserInfoRequest) -> None:
         """Update user information."""
         self._http.request(
             "POST",
-            f"/v1/{self._organization_id}/user/{user_id}",
-            json=body.model_dump(mode="json", exclude_none=True),
+            f"{self._base}/user/{user_id}",
+            content=_dump_json_bytes(body),
+            headers=_JSON_HEADERS,
         )
 
     def get_user_model(self, user_id: str) -> UserGetUserModelResponse:
         """Get the latest user model for a user."""
         response = self._http.request(
             "GET",
-            f"/v1/{self._organization_id}/user/{user_id}/user_model",
+            f"{self._base}/user/{user_id}/user_model",
         )
-        return UserGetUserModelResponse.model_validate_json(response.text)
+        return UserGetUserModelResponse.model_validate_json(response.content)
 
     # --- Convenience aliases ---
 
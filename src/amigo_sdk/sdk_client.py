@@ -31,6 +31,7 @@ class AsyncAmigoClient:
         organization_id: str | None = None,
         base_url: str | None = None,
         config: AmigoConfig | None = None,
+        trust_server: bool = False,
         **httpx_kwargs: Any,
     ):
         """
@@ -43,6 +44,10 @@ class AsyncAmigoClient:
             organization_id: Organization ID for API requests (or set AMIGO_ORGANIZATION_ID env var)
             base_url: Base URL for the API (or set AMIGO_BASE_URL env var)
             config: Pre-configured AmigoConfig instance (overrides individual params)
+            trust_server: Skip Pydantic validation of streamed NDJSON events
+                (they are `model_construct`ed instead; nested fields keep their
+                typed models). Only enable when talking to the Amigo API
+                directly; keep validation on for untrusted input.
             **httpx_kwargs: Additional arguments passed to httpx.AsyncClient
         """
         if config:
@@ -77,7 +82,7 @@ class AsyncAmigoClient:
         )
         self._services = AsyncServiceResource(self._http, self._cfg.organization_id)
         self._conversations = AsyncConversationResource(
-            self._http, self._cfg.organization_id
+            self._http, self._cfg.organization_id, trust_server=trust_server
         )
         self._users = AsyncUserResource(self._http, self._cfg.organization_id)
         self._agents = AsyncAgentResource(self._http, self._cfg.organization_id)
@@ -144,6 +149,7 @@ class AmigoClient:
         organization_id: str | None = None,
         base_url: str | None = None,
         config: AmigoConfig | None = None,
+        trust_server: bool = False,
         **httpx_kwargs: Any,
     ):
         """Initialize the Amigo SDK client.
@@ -155,6 +161,10 @@ class AmigoClient:
             organization_id: Organization ID for API requests (or set AMIGO_ORGANIZATION_ID env var)
             base_url: Base URL for the API (or set AMIGO_BASE_URL env var)
             config: Pre-configured AmigoConfig instance (overrides individual params)
+            trust_server: Skip Pydantic validation of streamed NDJSON events
+                (they are `model_construct`ed instead; nested fields keep their
+                typed models). Only enable when talking to the Amigo API
+                directly; keep validation on for untrusted input.
             **httpx_kwargs: Additional arguments passed to httpx.Client
         """
         if config:
@@ -187,7 +197,7 @@ class AmigoClient:
         )
         self._services = ServiceResource(self._http, self._cfg.organization_id)
         self._conversations = ConversationResource(
-            self._http, self._cfg.organization_id
+            self._http, self._cfg.organization_id, trust_server=trust_server
         )
         self._users = UserResource(self._http, self._cfg.organization_id)
         self._agents = AgentResource(self._http, self._cfg.organization_id)
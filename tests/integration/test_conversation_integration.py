@@ -75,11 +75,14 @@ async def _finish_open_conversations_async(client: AsyncAmigoClient) -> None:
     except Exception:
         return
 
-    for conversation in getattr(convs, "conversations", []) or []:
-        try:
-            await client.conversations.finish_conversation(conversation.id)
-        except Exception:
-            pass
+    # Finish in parallel; cleanup cost is the slowest call, not the sum.
+    await asyncio.gather(
+        *(
+            client.conversations.finish_conversation(conversation.id)
+            for conversation in getattr(convs, "conversations", []) or []
+        ),
+        return_exceptions=True,
+    )
 
 
 def _finish_open_conversations_sync(client: AmigoClient) -> None:
@@ -228,22 +231,7 @@ async def pre_suite_cleanup() -> AsyncGenerator[None]:
             pass
 
         # Finish any ongoing conversations for this service (best-effort)
-        try:
-            convs = await client.conversations.get_conversations(
-                GetConversationsParametersQuery(
-                    service_id=[SERVICE_ID],
-                    is_finished=False,
-                    limit=25,
-                    sort_by=["-created_at"],
-                )
-            )
-            for c in getattr(convs, "conversations", []) or []:
-                try:
-                    await client.conversations.finish_conversation(c.id)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        await _finish_open_conversations_async(client)
 
     # Allow eventual consistency to settle
     await asyncio.sleep(0.5)
@@ -1,8 +1,8 @@
 import os
 
 import pytest
+import pytest_asyncio
 
-from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import AuthenticationError
 from amigo_sdk.generated.model import (
     OrganizationGetOrganizationResponse,
@@ -10,23 +10,25 @@ from amigo_sdk.generated.model import (
 )
 from amigo_sdk.sdk_client import AmigoClient, AsyncAmigoClient
 
+# Read once at import (tests/conftest.py has already run load_dotenv by then)
+# instead of re-running the getenv loop in every test that needs credentials.
+_REQUIRED_VARS = (
+    "AMIGO_API_KEY",
+    "AMIGO_API_KEY_ID",
+    "AMIGO_USER_ID",
+    "AMIGO_ORGANIZATION_ID",
+)
+_ENV = {var: os.getenv(var) for var in _REQUIRED_VARS}
+_MISSING_VARS = [var for var in _REQUIRED_VARS if not _ENV[var]]
 
-@pytest.fixture
-def required_env_vars():
-    """Check that required environment variables are set."""
-    required_vars = [
-        "AMIGO_API_KEY",
-        "AMIGO_API_KEY_ID",
-        "AMIGO_USER_ID",
-        "AMIGO_ORGANIZATION_ID",
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
 
-    if missing_vars:
+@pytest.fixture(scope="module")
+def required_env_vars():
+    """Fail fast (once per module) when integration credentials are missing."""
+    if _MISSING_VARS:
         pytest.fail(
             f"Integration tests require environment variables to be set.\n"
-            f"Missing: {', '.join(missing_vars)}\n\n"
+            f"Missing: {', '.join(_MISSING_VARS)}\n\n"
             f"Please set these environment variables or create a .env file in the project root:\n"
             f"AMIGO_API_KEY=your-api-key\n"
             f"AMIGO_API_KEY_ID=your-api-key-id\n"
@@ -35,10 +37,31 @@ def required_env_vars():
             f"AMIGO_BASE_URL=https://your-api-base-url (optional)"
         )
 
-    return {var: os.getenv(var) for var in required_vars}
+    return _ENV
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client():
+    """One shared async client for the module.
+
+    Opening a fresh AsyncAmigoClient per test rebuilds the httpx pool and
+    redoes the TLS handshake for every case; read-only tests can share a
+    single connection pool instead. Tests that need bad credentials keep
+    constructing their own client.
+    """
+    async with AsyncAmigoClient() as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def sync_client():
+    """Shared sync client for the module; see the async ``client`` fixture."""
+    with AmigoClient() as c:
+        yield c
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("org_integration")
 class TestOrganizationIntegration:
     agent_id: str | None = None
     """Integration tests for Amigo API.
@@ -51,57 +74,46 @@ class TestOrganizationIntegration:
     Tests will fail if required variables are missing.
     """
 
-    async def test_get_services(self):
+    async def test_get_services(self, client):
         """Test getting services."""
-        async with AsyncAmigoClient() as client:
-            services = await client.services.get_services()
+        services = await client.services.get_services()
 
-            assert services is not None
-            assert isinstance(services, ServiceGetServicesResponse)
+        assert services is not None
+        assert isinstance(services, ServiceGetServicesResponse)
 
-    async def test_get_organization(self):
+    async def test_get_organization(self, client):
         """Test getting organization details using environment variables for config."""
+        organization = await client.organizations.get()
 
-        # Create client using environment variables
-        async with AsyncAmigoClient() as client:
-            # Get organization details
-            organization = await client.organizations.get()
-
-            # Verify we got a valid response
-            assert organization is not None
-
-            # Verify response is the correct pydantic model type
-            assert isinstance(organization, OrganizationGetOrganizationResponse)
-
-            # Verify model can serialize (proves it's valid)
-            assert organization.model_dump_json() is not None
-
-            # Stable fields should always be present.
-            assert organization.org_id
-            assert organization.org_name
-
-            # Branding fields are optional on live classic org payloads.
-            assert organization.title is None or isinstance(organization.title, str)
-            assert organization.main_description is None or isinstance(
-                organization.main_description, str
-            )
-            assert organization.sub_description is None or isinstance(
-                organization.sub_description, str
-            )
-            assert organization.onboarding_instructions is None or isinstance(
-                organization.onboarding_instructions, list
-            )
-
-    async def test_invalid_credentials_raises_authentication_error(self):
-        """Test that invalid credentials raise appropriate authentication errors."""
+        # Verify we got a valid response
+        assert organization is not None
+
+        # Verify response is the correct pydantic model type
+        assert isinstance(organization, OrganizationGetOrganizationResponse)
+
+        # Verify model can serialize (proves it's valid)
+        assert organization.model_dump_json() is not None
 
-        # Fail if we don't have valid credentials to test with
-        if not os.getenv("AMIGO_API_KEY"):
-            pytest.fail(
-                "Cannot test authentication error handling without valid credentials.\n"
-                "Please set AMIGO_API_KEY environment variable."
-            )
+        # Stable fields should always be present.
+        assert organization.org_id
+        assert organization.org_name
 
+        # Branding fields are optional on live classic org payloads.
+        assert organization.title is None or isinstance(organization.title, str)
+        assert organization.main_description is None or isinstance(
+            organization.main_description, str
+        )
+        assert organization.sub_description is None or isinstance(
+            organization.sub_description, str
+        )
+        assert organization.onboarding_instructions is None or isinstance(
+            organization.onboarding_instructions, list
+        )
+
+    async def test_invalid_credentials_raises_authentication_error(
+        self, required_env_vars
+    ):
+        """Test that invalid credentials raise appropriate authentication errors."""
         # Create client with invalid API key
         with pytest.raises(AuthenticationError):
             async with AsyncAmigoClient(
@@ -109,89 +121,56 @@ class TestOrganizationIntegration:
             ) as client:
                 await client.organizations.get()
 
-    async def test_client_config_property(self, required_env_vars):
+    async def test_client_config_property(self, client, required_env_vars):
         """Test that the client config property works correctly."""
-
-        async with AsyncAmigoClient() as client:
-            config = client.config
-
-            # Verify config contains expected values
-            assert config.api_key == required_env_vars["AMIGO_API_KEY"]
-            assert config.api_key_id == required_env_vars["AMIGO_API_KEY_ID"]
-            assert config.user_id == required_env_vars["AMIGO_USER_ID"]
-            assert config.organization_id == required_env_vars["AMIGO_ORGANIZATION_ID"]
-            assert config.base_url == os.getenv(
-                "AMIGO_BASE_URL", "https://api.amigo.ai"
-            )
-
-    def test_config_creation(self, required_env_vars):
-        """Test that AmigoConfig can be created from environment variables."""
-        # This should work now with the fixed field aliases
-        config = AmigoConfig()
+        config = client.config
 
         # Verify config contains expected values
         assert config.api_key == required_env_vars["AMIGO_API_KEY"]
         assert config.api_key_id == required_env_vars["AMIGO_API_KEY_ID"]
         assert config.user_id == required_env_vars["AMIGO_USER_ID"]
         assert config.organization_id == required_env_vars["AMIGO_ORGANIZATION_ID"]
+        assert config.base_url == os.getenv("AMIGO_BASE_URL", "https://api.amigo.ai")
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("org_integration_sync")
 class TestOrganizationIntegrationSync:
-    def test_get_services(self):
-        with AmigoClient() as client:
-            services = client.services.get_services()
-
-            assert services is not None
-            assert isinstance(services, ServiceGetServicesResponse)
-
-    def test_get_organization(self):
-        with AmigoClient() as client:
-            organization = client.organizations.get()
-
-            assert organization is not None
-            assert isinstance(organization, OrganizationGetOrganizationResponse)
-            assert organization.model_dump_json() is not None
-            assert organization.org_id
-            assert organization.org_name
-            assert organization.title is None or isinstance(organization.title, str)
-            assert organization.main_description is None or isinstance(
-                organization.main_description, str
-            )
-            assert organization.sub_description is None or isinstance(
-                organization.sub_description, str
-            )
-            assert organization.onboarding_instructions is None or isinstance(
-                organization.onboarding_instructions, list
-            )
-
-    def test_invalid_credentials_raises_authentication_error(self):
-        if not os.getenv("AMIGO_API_KEY"):
-            pytest.fail(
-                "Cannot test authentication error handling without valid credentials.\n"
-                "Please set AMIGO_API_KEY environment variable."
-            )
+    def test_get_services(self, sync_client):
+        services = sync_client.services.get_services()
+
+        assert services is not None
+        assert isinstance(services, ServiceGetServicesResponse)
+
+    def test_get_organization(self, sync_client):
+        organization = sync_client.organizations.get()
+
+        assert organization is not None
+        assert isinstance(organization, OrganizationGetOrganizationResponse)
+        assert organization.model_dump_json() is not None
+        assert organization.org_id
+        assert organization.org_name
+        assert organization.title is None or isinstance(organization.title, str)
+        assert organization.main_description is None or isinstance(
+            organization.main_description, str
+        )
+        assert organization.sub_description is None or isinstance(
+            organization.sub_description, str
+        )
+        assert organization.onboarding_instructions is None or isinstance(
+            organization.onboarding_instructions, list
+        )
 
+    def test_invalid_credentials_raises_authentication_error(self, required_env_vars):
         with pytest.raises(AuthenticationError):
             with AmigoClient(api_key="invalid_key") as client:
                 client.organizations.get()
 
-    def test_client_config_property(self, required_env_vars):
-        with AmigoClient() as client:
-            config = client.config
-
-            assert config.api_key == required_env_vars["AMIGO_API_KEY"]
-            assert config.api_key_id == required_env_vars["AMIGO_API_KEY_ID"]
-            assert config.user_id == required_env_vars["AMIGO_USER_ID"]
-            assert config.organization_id == required_env_vars["AMIGO_ORGANIZATION_ID"]
-            assert config.base_url == os.getenv(
-                "AMIGO_BASE_URL", "https://api.amigo.ai"
-            )
-
-    def test_config_creation(self, required_env_vars):
-        config = AmigoConfig()
+    def test_client_config_property(self, sync_client, required_env_vars):
+        config = sync_client.config
 
         assert config.api_key == required_env_vars["AMIGO_API_KEY"]
         assert config.api_key_id == required_env_vars["AMIGO_API_KEY_ID"]
         assert config.user_id == required_env_vars["AMIGO_USER_ID"]
         assert config.organization_id == required_env_vars["AMIGO_ORGANIZATION_ID"]
+        assert config.base_url == os.getenv("AMIGO_BASE_URL", "https://api.amigo.ai")
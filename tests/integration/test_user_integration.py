@@ -1,4 +1,6 @@
+import itertools
 import os
+from uuid import uuid4
 
 import pytest
 
@@ -10,6 +12,16 @@ from amigo_sdk.generated.model import (
 )
 from amigo_sdk.sdk_client import AmigoClient, AsyncAmigoClient
 
+# One random tag per run plus a counter keeps test emails unique without
+# re-deriving a suffix from pid/clock in every test, and makes a given run's
+# users easy to spot when cleaning up after a failure.
+_RUN_TAG = uuid4().hex[:8]
+_counter = itertools.count()
+
+
+def _unique_email(prefix: str = "py-sdk-it") -> str:
+    return f"{prefix}-{_RUN_TAG}-{next(_counter)}@example.com"
+
 
 @pytest.mark.integration
 class TestUserIntegration:
@@ -18,8 +30,7 @@ class TestUserIntegration:
 
     async def test_create_user(self):
         async with AsyncAmigoClient() as client:
-            unique_suffix = str(os.getpid()) + "-" + str(int(os.times().elapsed * 1000))
-            email = f"py-sdk-it-{unique_suffix}@example.com"
+            email = _unique_email()
             body = UserCreateInvitedUserRequest(
                 first_name="PY",
                 last_name="SDK-IT",
@@ -82,7 +93,7 @@ class TestUserIntegration:
             body = UserCreateInvitedUserRequest(
                 first_name="Bad",
                 last_name="Role",
-                email=f"bad-role-{os.getpid()}@example.com",
+                email=_unique_email("bad-role"),
                 role_name="role-that-does-not-exist",
             )
             with pytest.raises(errors.NotFoundError):
@@ -121,8 +132,7 @@ class TestUserIntegrationSync:
 
     def test_create_user(self):
         with AmigoClient() as client:
-            unique_suffix = str(os.getpid()) + "-" + str(int(os.times().elapsed * 1000))
-            email = f"py-sdk-it-{unique_suffix}@example.com"
+            email = _unique_email()
             body = UserCreateInvitedUserRequest(
                 first_name="PY",
                 last_name="SDK-IT",
@@ -182,7 +192,7 @@ class TestUserIntegrationSync:
             body = UserCreateInvitedUserRequest(
                 first_name="Bad",
                 last_name="Role",
-                email=f"bad-role-{os.getpid()}@example.com",
+                email=_unique_email("bad-role"),
                 role_name="role-that-does-not-exist",
             )
             with pytest.raises(errors.NotFoundError):
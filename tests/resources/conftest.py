@@ -0,0 +1,19 @@
+import pytest
+
+from amigo_sdk.config import AmigoConfig
+
+
+@pytest.fixture(scope="session")
+def mock_config() -> AmigoConfig:
+    """Shared config for resource tests; built once per session.
+
+    test_conversation.py and test_user.py override this with their own
+    organization ids.
+    """
+    return AmigoConfig(
+        api_key="test-api-key",
+        api_key_id="test-api-key-id",
+        user_id="test-user-id",
+        organization_id="test-org-123",
+        base_url="https://api.example.com",
+    )
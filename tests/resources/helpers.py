@@ -1,8 +1,12 @@
 """Shared test helpers for resource tests."""
 
+import json
 from contextlib import asynccontextmanager, contextmanager
-from datetime import UTC, datetime, timedelta
-from unittest.mock import Mock, patch
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+from unittest.mock import patch
 
 from amigo_sdk.generated.model import (
     OrganizationGetOrganizationResponse,
@@ -11,6 +15,144 @@ from amigo_sdk.generated.model import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class FakeToken:
+    """Typed stand-in for the sign-in response; the client only reads these."""
+
+    id_token: str
+    expires_at: datetime
+
+
+# Far-future expiry keeps this token "fresh" for every test without a clock
+# read per mock_http_request call; tests never assert on the timestamp.
+_FRESH_TOKEN = FakeToken(
+    id_token="test-bearer-token",
+    expires_at=datetime(2099, 1, 1, tzinfo=UTC),
+)
+
+# Serialized-JSON cache for the memoized response-data singletons below.
+# Entries hold a strong reference to the model so id() keys stay unique.
+_model_json_cache: dict[int, tuple[object, str]] = {}
+
+
+def _model_json(model) -> str:
+    """Serialize a Pydantic mock payload once and reuse the JSON string."""
+    cached = _model_json_cache.get(id(model))
+    if cached is not None and cached[0] is model:
+        return cached[1]
+    text = model.model_dump_json()
+    _model_json_cache[id(model)] = (model, text)
+    return text
+
+
+class FakeResponse:
+    """Minimal httpx.Response stand-in with plain slot attribute access.
+
+    Covers the attributes the SDK touches on non-streaming responses:
+    status_code, is_success, text, content, headers, and json(). Dict
+    payloads are kept as-is and returned directly from json(); text and
+    content are rendered lazily only if a code path actually reads them.
+    """
+
+    __slots__ = ("status_code", "headers", "_data", "_text", "_content")
+
+    def __init__(
+        self,
+        status_code: int,
+        *,
+        data: Any = None,
+        text: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self._data = data
+        self._text = text
+        self._content: bytes | None = None
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = json.dumps(self._data)
+        return self._text
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.text.encode("utf-8")
+        return self._content
+
+    def json(self) -> Any:
+        if self._data is not None:
+            return self._data
+        return json.loads(self.text)
+
+
+def _fake_response(mock_response_data, status_code: int) -> FakeResponse:
+    """Build a FakeResponse from a Pydantic model, JSON string, or dict."""
+    if hasattr(mock_response_data, "model_dump_json"):
+        return FakeResponse(status_code, text=_model_json(mock_response_data))
+    if isinstance(mock_response_data, str):
+        return FakeResponse(status_code, text=mock_response_data)
+    return FakeResponse(status_code, data=mock_response_data)
+
+
+class _AsyncStreamResponse:
+    """Async stream stub serving NDJSON bytes through aiter_bytes."""
+
+    __slots__ = ("status_code", "_content")
+
+    def __init__(self, status_code: int, lines: list[str]) -> None:
+        self.status_code = status_code
+        self._content = "".join(f"{ln}\n" for ln in lines).encode("utf-8")
+
+    async def aiter_bytes(self, chunk_size: int = 65536):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i : i + chunk_size]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _SyncStreamResponse:
+    """Sync stream stub serving NDJSON bytes through iter_bytes."""
+
+    __slots__ = ("status_code", "_content")
+
+    def __init__(self, status_code: int, lines: list[str]) -> None:
+        self.status_code = status_code
+        self._content = "".join(f"{ln}\n" for ln in lines).encode("utf-8")
+
+    def iter_bytes(self, chunk_size: int = 65536):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i : i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _normalize_stream_lines(items) -> list[str]:
+    out = []
+    for item in items:
+        if hasattr(item, "model_dump_json"):
+            out.append(item.model_dump_json())
+        elif isinstance(item, str):
+            out.append(item)
+        else:
+            out.append(json.dumps(item))
+    return out
+
+
 @asynccontextmanager
 async def mock_http_request(mock_response_data, status_code=200):
     """
@@ -20,30 +162,12 @@ async def mock_http_request(mock_response_data, status_code=200):
         mock_response_data: The data to return in the response (can be JSON string or Pydantic object)
         status_code: HTTP status code to return (default: 200)
     """
-    # Create mock response
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    mock_response.is_success = status_code < 400
-
-    # Convert payload to JSON string for response.text
-    if hasattr(mock_response_data, "model_dump_json"):
-        mock_response.text = mock_response_data.model_dump_json()
-    elif isinstance(mock_response_data, str):
-        mock_response.text = mock_response_data
-    else:
-        import json as _json
-
-        mock_response.text = _json.dumps(mock_response_data)
-
-    # Create fresh auth token
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+    mock_response = _fake_response(mock_response_data, status_code)
 
     with (
         patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
+            "amigo_sdk.http_client.sign_in_with_api_key_async",
+            return_value=_FRESH_TOKEN,
         ),
         patch("httpx.AsyncClient.request", return_value=mock_response),
     ):
@@ -57,49 +181,19 @@ async def mock_http_stream(lines, status_code: int = 200):
     lines: list of dicts or JSON strings that will be yielded line-by-line.
     status_code: HTTP status code to expose on the stream response.
     """
-    # Normalize to JSON strings
-    json_lines = []
-    for item in lines:
-        if hasattr(item, "model_dump_json"):
-            json_lines.append(item.model_dump_json())
-        elif isinstance(item, str):
-            json_lines.append(item)
-        else:
-            import json as _json
-
-            json_lines.append(_json.dumps(item))
-
-    class _MockStreamResponse:
-        def __init__(self, status_code: int, lines: list[str]):
-            self.status_code = status_code
-            self._lines = lines
-
-        async def aiter_lines(self):
-            for ln in self._lines:
-                yield ln
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+    json_lines = _normalize_stream_lines(lines)
 
     # Track last call data for assertions
     tracker = {"last_call": None}
 
     def _mock_stream(self, method, url, **kwargs):  # noqa: ANN001
         tracker["last_call"] = {"method": method, "url": url, **kwargs}
-        return _MockStreamResponse(status_code, json_lines)
-
-    # Create fresh auth token
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+        return _AsyncStreamResponse(status_code, json_lines)
 
     with (
         patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
+            "amigo_sdk.http_client.sign_in_with_api_key_async",
+            return_value=_FRESH_TOKEN,
         ),
         patch("httpx.AsyncClient.stream", _mock_stream),
     ):
@@ -114,34 +208,6 @@ async def mock_http_stream_sequence(sequence):
     Yields a tracker dict with 'last_call' and 'call_count'.
     """
 
-    def _normalize_lines(items):
-        out = []
-        for item in items:
-            if hasattr(item, "model_dump_json"):
-                out.append(item.model_dump_json())
-            elif isinstance(item, str):
-                out.append(item)
-            else:
-                import json as _json
-
-                out.append(_json.dumps(item))
-        return out
-
-    class _MockStreamResponse:
-        def __init__(self, status_code: int, lines: list[str]):
-            self.status_code = status_code
-            self._lines = lines
-
-        async def aiter_lines(self):
-            for ln in self._lines:
-                yield ln
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
     idx = {"i": 0}
     tracker = {"last_call": None, "call_count": 0}
 
@@ -153,16 +219,12 @@ async def mock_http_stream_sequence(sequence):
             i = len(sequence) - 1
         status_code, lines = sequence[i]
         idx["i"] += 1
-        return _MockStreamResponse(status_code, _normalize_lines(lines))
-
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+        return _AsyncStreamResponse(status_code, _normalize_stream_lines(lines))
 
     with (
         patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
+            "amigo_sdk.http_client.sign_in_with_api_key_async",
+            return_value=_FRESH_TOKEN,
         ),
         patch("httpx.AsyncClient.stream", _mock_stream),
     ):
@@ -178,26 +240,10 @@ def mock_http_request_sync(mock_response_data, status_code=200):
 
     Returns a context manager yielding the mock response object.
     """
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    mock_response.is_success = status_code < 400
-
-    if hasattr(mock_response_data, "model_dump_json"):
-        mock_response.text = mock_response_data.model_dump_json()
-    elif isinstance(mock_response_data, str):
-        mock_response.text = mock_response_data
-    else:
-        import json as _json
-
-        mock_response.text = _json.dumps(mock_response_data)
-
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+    mock_response = _fake_response(mock_response_data, status_code)
 
     with (
-        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh_token),
+        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=_FRESH_TOKEN),
         patch("httpx.Client.request", return_value=mock_response),
     ):
         yield mock_response
@@ -207,47 +253,19 @@ def mock_http_request_sync(mock_response_data, status_code=200):
 def mock_http_stream_sync(lines, status_code: int = 200):
     """Mock httpx.Client.stream for NDJSON sync endpoints.
 
-    lines: list of dicts or JSON strings yielded line-by-line by iter_lines().
+    lines: list of dicts or JSON strings served as NDJSON bytes via iter_bytes().
     Returns a tracker dict capturing call details.
     """
-    json_lines = []
-    for item in lines:
-        if hasattr(item, "model_dump_json"):
-            json_lines.append(item.model_dump_json())
-        elif isinstance(item, str):
-            json_lines.append(item)
-        else:
-            import json as _json
-
-            json_lines.append(_json.dumps(item))
-
-    class _MockStreamResponse:
-        def __init__(self, status_code: int, lines: list[str]):
-            self.status_code = status_code
-            self._lines = lines
-
-        def iter_lines(self):
-            yield from self._lines
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    json_lines = _normalize_stream_lines(lines)
 
     tracker = {"last_call": None}
 
     def _mock_stream(self, method, url, **kwargs):  # noqa: ANN001
         tracker["last_call"] = {"method": method, "url": url, **kwargs}
-        return _MockStreamResponse(status_code, json_lines)
-
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+        return _SyncStreamResponse(status_code, json_lines)
 
     with (
-        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh_token),
+        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=_FRESH_TOKEN),
         patch("httpx.Client.stream", _mock_stream),
     ):
         yield tracker
@@ -261,33 +279,6 @@ def mock_http_stream_sequence_sync(sequence):
     Yields a tracker dict with 'last_call' and 'call_count'.
     """
 
-    def _normalize_lines(items):
-        out = []
-        for item in items:
-            if hasattr(item, "model_dump_json"):
-                out.append(item.model_dump_json())
-            elif isinstance(item, str):
-                out.append(item)
-            else:
-                import json as _json
-
-                out.append(_json.dumps(item))
-        return out
-
-    class _MockStreamResponse:
-        def __init__(self, status_code: int, lines: list[str]):
-            self.status_code = status_code
-            self._lines = lines
-
-        def iter_lines(self):
-            yield from self._lines
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
     idx = {"i": 0}
     tracker = {"last_call": None, "call_count": 0}
 
@@ -299,22 +290,22 @@ def mock_http_stream_sequence_sync(sequence):
             i = len(sequence) - 1
         status_code, lines = sequence[i]
         idx["i"] += 1
-        return _MockStreamResponse(status_code, _normalize_lines(lines))
-
-    fresh_token = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+        return _SyncStreamResponse(status_code, _normalize_stream_lines(lines))
 
     with (
-        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh_token),
+        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=_FRESH_TOKEN),
         patch("httpx.Client.stream", _mock_stream),
     ):
         yield tracker
 
 
+@lru_cache(maxsize=1)
 def create_organization_response_data() -> OrganizationGetOrganizationResponse:
-    """Create mock data matching OrganizationGetOrganizationResponse schema."""
+    """Create mock data matching OrganizationGetOrganizationResponse schema.
+
+    Cached: tests only read the returned model, so one shared instance
+    avoids re-running Pydantic validation for every test.
+    """
     return OrganizationGetOrganizationResponse(
         org_id="test-org-123",
         org_name="Test Organization",
@@ -330,8 +321,13 @@ def create_organization_response_data() -> OrganizationGetOrganizationResponse:
     )
 
 
+@lru_cache(maxsize=1)
 def create_services_response_data() -> ServiceGetServicesResponse:
-    """Create mock data matching ServiceGetServicesResponse schema."""
+    """Create mock data matching ServiceGetServicesResponse schema.
+
+    Cached: tests only read the returned model, so one shared instance
+    avoids re-running Pydantic validation for every test.
+    """
     return ServiceGetServicesResponse(
         services=[
             ServiceInstance(
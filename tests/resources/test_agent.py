@@ -1,6 +1,5 @@
 import pytest
 
-from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import NotFoundError
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 from amigo_sdk.resources.agent import AgentResource, AsyncAgentResource
@@ -8,17 +7,6 @@ from amigo_sdk.resources.agent import AgentResource, AsyncAgentResource
 from .helpers import mock_http_request, mock_http_request_sync
 
 
-@pytest.fixture
-def mock_config():
-    return AmigoConfig(
-        api_key="test-api-key",
-        api_key_id="test-api-key-id",
-        user_id="test-user-id",
-        organization_id="test-org-123",
-        base_url="https://api.example.com",
-    )
-
-
 @pytest.fixture
 def agent_resource(mock_config) -> AsyncAgentResource:
     http_client = AmigoAsyncHttpClient(mock_config)
@@ -28,11 +16,25 @@ def agent_resource(mock_config) -> AsyncAgentResource:
 @pytest.mark.unit
 class TestAgentResource:
     @pytest.mark.asyncio
-    async def test_get_agents_returns_data(self, agent_resource):
-        mock_data = {"agents": [], "has_more": False, "continuation_token": None}
-        async with mock_http_request(mock_data):
-            result = await agent_resource.get_agents()
-            assert result.has_more is False
+    @pytest.mark.parametrize(
+        ("status_code", "expected_error"),
+        [(200, None), (404, NotFoundError)],
+    )
+    async def test_get_agents_status_handling(
+        self, agent_resource, status_code, expected_error
+    ):
+        payload = (
+            {"agents": [], "has_more": False, "continuation_token": None}
+            if expected_error is None
+            else {"detail": "not found"}
+        )
+        async with mock_http_request(payload, status_code=status_code):
+            if expected_error is None:
+                result = await agent_resource.get_agents()
+                assert result.has_more is False
+            else:
+                with pytest.raises(expected_error):
+                    await agent_resource.get_agents()
 
     @pytest.mark.asyncio
     async def test_create_agent_returns_id(self, agent_resource):
@@ -49,12 +51,6 @@ class TestAgentResource:
         async with mock_http_request("", status_code=204):
             await agent_resource.delete_agent("agent-123")
 
-    @pytest.mark.asyncio
-    async def test_get_agents_404_raises(self, agent_resource):
-        async with mock_http_request('{"detail": "not found"}', status_code=404):
-            with pytest.raises(NotFoundError):
-                await agent_resource.get_agents()
-
     @pytest.mark.asyncio
     async def test_list_alias(self, agent_resource):
         mock_data = {"agents": [], "has_more": False, "continuation_token": None}
@@ -1,6 +1,5 @@
 import pytest
 
-from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import NotFoundError
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 from amigo_sdk.resources.context_graph import (
@@ -11,17 +10,6 @@ from amigo_sdk.resources.context_graph import (
 from .helpers import mock_http_request, mock_http_request_sync
 
 
-@pytest.fixture
-def mock_config():
-    return AmigoConfig(
-        api_key="test-api-key",
-        api_key_id="test-api-key-id",
-        user_id="test-user-id",
-        organization_id="test-org-123",
-        base_url="https://api.example.com",
-    )
-
-
 @pytest.fixture
 def cg_resource(mock_config) -> AsyncContextGraphResource:
     http_client = AmigoAsyncHttpClient(mock_config)
@@ -62,7 +50,7 @@ class TestContextGraphResource:
 
     @pytest.mark.asyncio
     async def test_get_context_graphs_404_raises(self, cg_resource):
-        async with mock_http_request('{"detail": "not found"}', status_code=404):
+        async with mock_http_request({"detail": "not found"}, status_code=404):
             with pytest.raises(NotFoundError):
                 await cg_resource.get_context_graphs()
 
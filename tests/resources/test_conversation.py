@@ -9,14 +9,18 @@ from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import BadRequestError, ConflictError, NotFoundError
 from amigo_sdk.generated.model import (
     ConversationCreateConversationRequest,
+    ConversationCreatedEvent,
     ConversationGenerateConversationStarterRequest,
     CreateConversationParametersQuery,
+    CurrentAgentActionEvent,
     Format,
     GetConversationMessagesParametersQuery,
     GetConversationsParametersQuery,
     InteractWithConversationParametersQuery,
+    NewMessageEvent,
     PCMUserMessageAudioConfig,
     SampleWidth,
+    TranscriptAlignmentItem,
 )
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 from amigo_sdk.resources.conversation import (
@@ -36,6 +40,31 @@ TEST_SERVICE_ID = "0123456789abcdef01234567"
 TEST_SERVICE_ID_2 = "89abcdef0123456701234567"
 TEST_INTERACTION_ID = "fedcba987654321001234567"
 
+# Query-param models reused across tests; the resources only read/dump these,
+# so sharing one instance skips redundant Pydantic validation per test.
+TEXT_CONVERSATION_PARAMS = CreateConversationParametersQuery(
+    response_format=Format.text
+)
+TEXT_INTERACT_PARAMS = InteractWithConversationParametersQuery(
+    request_format=Format.text, response_format=Format.text
+)
+
+# Trusted-mode payloads with nested fields (see _construct_trusted_event):
+# current-agent-action carries a nested action union, new-message carries
+# transcript-alignment items.
+AGENT_ACTION_EVENT_DATA = {
+    "type": "current-agent-action",
+    "action": {"type": "check-if-active-memory-needed-completed", "queries": ["q-1"]},
+}
+NEW_MESSAGE_EVENT_DATA = {
+    "type": "new-message",
+    "message": "hi",
+    "transcript_alignment": [[0, "h"], [120, "i"]],
+    "stop": True,
+    "sequence_number": 0,
+    "message_id": "m-1",
+}
+
 
 def _multipart_values(files: object, field: str) -> list[str]:
     if isinstance(files, dict):
@@ -66,7 +95,7 @@ def _recorded_message_part(files: object) -> tuple[object, ...]:
     raise AssertionError("recorded_message part not found")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config() -> AmigoConfig:
     return AmigoConfig(
         api_key="test-api-key",
@@ -115,7 +144,7 @@ class TestAsyncConversationResourceUnit:
                     service_id=TEST_SERVICE_ID,
                     service_version_set_name="release",
                 ),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
             )
 
             saw_new_message = False
@@ -135,6 +164,63 @@ class TestAsyncConversationResourceUnit:
             assert interaction_id == "i-1"
             assert saw_new_message is True
 
+    @pytest.mark.asyncio
+    async def test_create_conversation_trust_server_constructs_events(
+        self, mock_config: AmigoConfig
+    ) -> None:
+        resource = AsyncConversationResource(
+            AmigoAsyncHttpClient(mock_config),
+            mock_config.organization_id,
+            trust_server=True,
+        )
+        async with mock_http_stream(
+            [{"type": "conversation-created", "conversation_id": "c-1"}]
+        ):
+            events = await resource.create_conversation(
+                ConversationCreateConversationRequest(
+                    service_id=TEST_SERVICE_ID,
+                    service_version_set_name="release",
+                ),
+                TEXT_CONVERSATION_PARAMS,
+            )
+            got = [evt async for evt in events]
+
+        assert len(got) == 1
+        assert isinstance(got[0].root, ConversationCreatedEvent)
+        assert got[0].root.conversation_id == "c-1"
+
+    @pytest.mark.asyncio
+    async def test_create_conversation_trust_server_keeps_nested_models(
+        self, mock_config: AmigoConfig
+    ) -> None:
+        """Trusted mode must hand back typed nested fields, not raw dicts."""
+        resource = AsyncConversationResource(
+            AmigoAsyncHttpClient(mock_config),
+            mock_config.organization_id,
+            trust_server=True,
+        )
+        async with mock_http_stream([AGENT_ACTION_EVENT_DATA, NEW_MESSAGE_EVENT_DATA]):
+            events = await resource.create_conversation(
+                ConversationCreateConversationRequest(
+                    service_id=TEST_SERVICE_ID,
+                    service_version_set_name="release",
+                ),
+                TEXT_CONVERSATION_PARAMS,
+            )
+            got = [evt async for evt in events]
+
+        action_evt, message_evt = got[0].root, got[1].root
+        # current-agent-action takes the full-validation path, so its nested
+        # action union is a real model.
+        assert isinstance(action_evt, CurrentAgentActionEvent)
+        assert action_evt.action.root.queries == ["q-1"]
+        assert isinstance(message_evt, NewMessageEvent)
+        assert all(
+            isinstance(item, TranscriptAlignmentItem)
+            for item in message_evt.transcript_alignment
+        )
+        assert message_evt.transcript_alignment[0].root == (0, "h")
+
     @pytest.mark.asyncio
     async def test_create_conversation_sends_body_and_query(
         self, conversation_resource: AsyncConversationResource
@@ -142,7 +228,7 @@ class TestAsyncConversationResourceUnit:
         body = ConversationCreateConversationRequest(
             service_id=TEST_SERVICE_ID, service_version_set_name="release"
         )
-        params = CreateConversationParametersQuery(response_format=Format.text)
+        params = TEXT_CONVERSATION_PARAMS
 
         async with mock_http_stream(
             [
@@ -161,7 +247,7 @@ class TestAsyncConversationResourceUnit:
             call = tracker["last_call"]
             assert call["method"] == "POST"
             assert call["url"].endswith("/v1/org-1/conversation/")
-            assert call["json"]["service_id"] == TEST_SERVICE_ID
+            assert json.loads(call["content"])["service_id"] == TEST_SERVICE_ID
             assert call["params"]["response_format"] == "text"
 
     @pytest.mark.asyncio
@@ -173,7 +259,7 @@ class TestAsyncConversationResourceUnit:
         async with mock_http_stream([]):
             events = await conversation_resource.create_conversation(
                 ConversationCreateConversationRequest(service_id=TEST_SERVICE_ID),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
                 abort_event=abort,
             )
             async for _ in events:
@@ -186,7 +272,7 @@ class TestAsyncConversationResourceUnit:
         async with mock_http_stream([], status_code=400):
             events = await conversation_resource.create_conversation(
                 ConversationCreateConversationRequest(service_id=TEST_SERVICE_ID),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
             )
             with pytest.raises(BadRequestError):
                 async for _ in events:
@@ -218,9 +304,7 @@ class TestAsyncConversationResourceUnit:
         ) as tracker:
             events = await conversation_resource.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hello",
             )
             async for _ in events:
@@ -309,9 +393,7 @@ class TestAsyncConversationResourceUnit:
         ) as tracker:
             events = await conversation_resource.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 initial_message_type="external-event",
                 text_message="event occurred",
             )
@@ -341,9 +423,7 @@ class TestAsyncConversationResourceUnit:
         ) as tracker:
             events = await conversation_resource.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 initial_message_type="external-event",
                 text_message="primary event",
                 external_event_message_content=["event-a", "event-b"],
@@ -374,9 +454,7 @@ class TestAsyncConversationResourceUnit:
         async with mock_http_stream([]):
             events = await conversation_resource.interact_with_conversation(
                 "conv-x",
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hi",
                 abort_event=abort,
             )
@@ -390,9 +468,7 @@ class TestAsyncConversationResourceUnit:
         async with mock_http_stream([], status_code=400):
             events = await conversation_resource.interact_with_conversation(
                 "conv-err",
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hi",
             )
             with pytest.raises(BadRequestError):
@@ -420,7 +496,7 @@ class TestAsyncConversationResourceUnit:
     async def test_get_conversations_raises_not_found(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.get_conversations(
                     GetConversationsParametersQuery()
@@ -461,7 +537,7 @@ class TestAsyncConversationResourceUnit:
     async def test_get_conversation_messages_raises_not_found(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.get_conversation_messages(
                     "missing", GetConversationMessagesParametersQuery()
@@ -471,14 +547,14 @@ class TestAsyncConversationResourceUnit:
     async def test_finish_conversation_returns_void_on_204(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=204):
+        async with mock_http_request({}, status_code=204):
             await conversation_resource.finish_conversation("conv-4")
 
     @pytest.mark.asyncio
     async def test_finish_conversation_raises_conflict_on_409(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=409):
+        async with mock_http_request({}, status_code=409):
             with pytest.raises(ConflictError):
                 await conversation_resource.finish_conversation("conv-6")
 
@@ -486,7 +562,7 @@ class TestAsyncConversationResourceUnit:
     async def test_finish_conversation_raises_not_found_on_404(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.finish_conversation("missing")
 
@@ -504,7 +580,7 @@ class TestAsyncConversationResourceUnit:
     async def test_recommend_responses_raises_not_found(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.recommend_responses_for_interaction(
                     "conv-7", "missing"
@@ -536,7 +612,7 @@ class TestAsyncConversationResourceUnit:
     async def test_get_interaction_insights_raises_not_found(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.get_interaction_insights(
                     "conv-8", "missing"
@@ -560,7 +636,7 @@ class TestAsyncConversationResourceUnit:
     async def test_get_message_source_raises_not_found(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await conversation_resource.get_message_source("conv-9", "missing")
 
@@ -587,7 +663,7 @@ class TestAsyncConversationResourceUnit:
     async def test_generate_conversation_starters_raises_on_non_2xx(
         self, conversation_resource: AsyncConversationResource
     ) -> None:
-        async with mock_http_request("{}", status_code=400):
+        async with mock_http_request({}, status_code=400):
             with pytest.raises(BadRequestError):
                 await conversation_resource.generate_conversation_starters(
                     ConversationGenerateConversationStarterRequest(
@@ -639,7 +715,7 @@ class TestConversationResourceSync:
                     service_id=TEST_SERVICE_ID,
                     service_version_set_name="release",
                 ),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
             )
 
             saw_new_message = False
@@ -659,6 +735,58 @@ class TestConversationResourceSync:
             assert interaction_id == "i-1"
             assert saw_new_message is True
 
+    def test_create_conversation_trust_server_constructs_events_sync(
+        self, mock_config: AmigoConfig
+    ) -> None:
+        conv = ConversationResource(
+            AmigoHttpClient(mock_config),
+            mock_config.organization_id,
+            trust_server=True,
+        )
+        with mock_http_stream_sync(
+            [{"type": "conversation-created", "conversation_id": "c-1"}]
+        ):
+            events = conv.create_conversation(
+                ConversationCreateConversationRequest(
+                    service_id=TEST_SERVICE_ID,
+                    service_version_set_name="release",
+                ),
+                TEXT_CONVERSATION_PARAMS,
+            )
+            got = list(events)
+
+        assert len(got) == 1
+        assert isinstance(got[0].root, ConversationCreatedEvent)
+        assert got[0].root.conversation_id == "c-1"
+
+    def test_create_conversation_trust_server_keeps_nested_models_sync(
+        self, mock_config: AmigoConfig
+    ) -> None:
+        conv = ConversationResource(
+            AmigoHttpClient(mock_config),
+            mock_config.organization_id,
+            trust_server=True,
+        )
+        with mock_http_stream_sync([AGENT_ACTION_EVENT_DATA, NEW_MESSAGE_EVENT_DATA]):
+            events = conv.create_conversation(
+                ConversationCreateConversationRequest(
+                    service_id=TEST_SERVICE_ID,
+                    service_version_set_name="release",
+                ),
+                TEXT_CONVERSATION_PARAMS,
+            )
+            got = list(events)
+
+        action_evt, message_evt = got[0].root, got[1].root
+        assert isinstance(action_evt, CurrentAgentActionEvent)
+        assert action_evt.action.root.queries == ["q-1"]
+        assert isinstance(message_evt, NewMessageEvent)
+        assert all(
+            isinstance(item, TranscriptAlignmentItem)
+            for item in message_evt.transcript_alignment
+        )
+        assert message_evt.transcript_alignment[0].root == (0, "h")
+
     def test_create_conversation_sends_body_and_query_sync(
         self, mock_config: AmigoConfig
     ) -> None:
@@ -666,7 +794,7 @@ class TestConversationResourceSync:
         body = ConversationCreateConversationRequest(
             service_id=TEST_SERVICE_ID, service_version_set_name="release"
         )
-        params = CreateConversationParametersQuery(response_format=Format.text)
+        params = TEXT_CONVERSATION_PARAMS
 
         with mock_http_stream_sync(
             [
@@ -684,7 +812,7 @@ class TestConversationResourceSync:
             call = tracker["last_call"]
             assert call["method"] == "POST"
             assert call["url"].endswith("/v1/org-1/conversation/")
-            assert call["json"]["service_id"] == TEST_SERVICE_ID
+            assert json.loads(call["content"])["service_id"] == TEST_SERVICE_ID
             assert call["params"]["response_format"] == "text"
 
     def test_create_conversation_supports_abort_sync(
@@ -696,7 +824,7 @@ class TestConversationResourceSync:
         with mock_http_stream_sync([]):
             events = conv.create_conversation(
                 ConversationCreateConversationRequest(service_id=TEST_SERVICE_ID),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
                 abort_event=abort_event,
             )
             for _ in events:
@@ -709,7 +837,7 @@ class TestConversationResourceSync:
         with mock_http_stream_sync([], status_code=400):
             events = conv.create_conversation(
                 ConversationCreateConversationRequest(service_id=TEST_SERVICE_ID),
-                CreateConversationParametersQuery(response_format=Format.text),
+                TEXT_CONVERSATION_PARAMS,
             )
             with pytest.raises(BadRequestError):
                 list(events)
@@ -740,9 +868,7 @@ class TestConversationResourceSync:
         ) as tracker:
             events = conv.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hello",
             )
             next(events)
@@ -830,9 +956,7 @@ class TestConversationResourceSync:
         ) as tracker:
             events = conv.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 initial_message_type="external-event",
                 text_message="event occurred",
             )
@@ -861,9 +985,7 @@ class TestConversationResourceSync:
         ) as tracker:
             events = conv.interact_with_conversation(
                 TEST_INTERACTION_ID,
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 initial_message_type="external-event",
                 text_message="primary event",
                 external_event_message_content=["event-a", "event-b"],
@@ -893,9 +1015,7 @@ class TestConversationResourceSync:
         with mock_http_stream_sync([]):
             events = conv.interact_with_conversation(
                 "conv-x",
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hi",
                 abort_event=abort_event,
             )
@@ -909,9 +1029,7 @@ class TestConversationResourceSync:
         with mock_http_stream_sync([], status_code=400):
             events = conv.interact_with_conversation(
                 "conv-err",
-                InteractWithConversationParametersQuery(
-                    request_format=Format.text, response_format=Format.text
-                ),
+                TEXT_INTERACT_PARAMS,
                 text_message="hi",
             )
             with pytest.raises(BadRequestError):
@@ -938,7 +1056,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.get_conversations(GetConversationsParametersQuery())
 
@@ -977,7 +1095,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.get_conversation_messages(
                     "missing", GetConversationMessagesParametersQuery()
@@ -987,14 +1105,14 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=204):
+        with mock_http_request_sync({}, status_code=204):
             assert conv.finish_conversation("conv-4") is None
 
     def test_finish_conversation_raises_conflict_on_409_sync(
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=409):
+        with mock_http_request_sync({}, status_code=409):
             with pytest.raises(ConflictError):
                 conv.finish_conversation("conv-6")
 
@@ -1002,7 +1120,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.finish_conversation("missing")
 
@@ -1018,7 +1136,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.recommend_responses_for_interaction("conv-7", "missing")
 
@@ -1046,7 +1164,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.get_interaction_insights("conv-8", "missing")
 
@@ -1068,7 +1186,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 conv.get_message_source("conv-9", "missing")
 
@@ -1095,7 +1213,7 @@ class TestConversationResourceSync:
         self, mock_config: AmigoConfig
     ) -> None:
         conv = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=400):
+        with mock_http_request_sync({}, status_code=400):
             with pytest.raises(BadRequestError):
                 conv.generate_conversation_starters(
                     ConversationGenerateConversationStarterRequest(
@@ -1,6 +1,5 @@
 import pytest
 
-from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import NotFoundError
 from amigo_sdk.generated.model import (
     OrganizationGetOrganizationResponse,
@@ -18,17 +17,6 @@ from .helpers import (
 )
 
 
-@pytest.fixture
-def mock_config():
-    return AmigoConfig(
-        api_key="test-api-key",
-        api_key_id="test-api-key-id",
-        user_id="test-user-id",
-        organization_id="test-org-123",
-        base_url="https://api.example.com",
-    )
-
-
 @pytest.fixture
 def organization_resource(mock_config) -> AsyncOrganizationResource:
     http_client = AmigoAsyncHttpClient(mock_config)
@@ -40,31 +28,46 @@ class TestOrganizationResource:
     """Simple test suite for the Organization Resource."""
 
     @pytest.mark.asyncio
-    async def test_get_organization_returns_expected_data(
-        self, organization_resource: AsyncOrganizationResource
+    @pytest.mark.parametrize(
+        ("status_code", "expected_error"),
+        [(200, None), (404, NotFoundError)],
+    )
+    async def test_get_organization_status_handling(
+        self,
+        organization_resource: AsyncOrganizationResource,
+        status_code: int,
+        expected_error: type[Exception] | None,
     ):
-        """Test get method returns properly parsed organization data."""
-        mock_data = create_organization_response_data()
-
-        async with mock_http_request(mock_data):
-            result = await organization_resource.get()
-
-            assert isinstance(result, OrganizationGetOrganizationResponse)
-            assert result.org_id == "test-org-123"
-            assert result.org_name == "Test Organization"
-            assert result.title == "Your AI Assistant Platform"
-            assert len(result.onboarding_instructions) == 2
+        """get parses the happy path and maps 404 to NotFoundError."""
+        payload = (
+            create_organization_response_data()
+            if expected_error is None
+            else {"error": "Organization not found"}
+        )
+        async with mock_http_request(payload, status_code=status_code):
+            if expected_error is None:
+                result = await organization_resource.get()
+                assert isinstance(result, OrganizationGetOrganizationResponse)
+                assert result.org_id == "test-org-123"
+                assert result.org_name == "Test Organization"
+                assert result.title == "Your AI Assistant Platform"
+                assert len(result.onboarding_instructions) == 2
+            else:
+                with pytest.raises(expected_error):
+                    await organization_resource.get()
 
     @pytest.mark.asyncio
-    async def test_get_nonexistent_organization_raises_not_found(
+    async def test_get_organization_serves_repeat_calls_from_cache(
         self, organization_resource: AsyncOrganizationResource
     ) -> None:
-        """Test get method raises NotFoundError for non-existent organization."""
-        async with mock_http_request(
-            '{"error": "Organization not found"}', status_code=404
-        ):
-            with pytest.raises(NotFoundError):
-                await organization_resource.get()
+        """Repeat gets within the TTL reuse the same parsed response."""
+        mock_data = create_organization_response_data()
+
+        async with mock_http_request(mock_data):
+            first = await organization_resource.get()
+            second = await organization_resource.get()
+
+        assert first is second
 
     @pytest.mark.asyncio
     async def test_get_organization_accepts_missing_optional_branding_fields(
@@ -94,24 +97,38 @@ class TestOrganizationResourceSync:
         http = AmigoHttpClient(mock_config)
         return OrganizationResource(http, mock_config.organization_id)
 
-    def test_get_organization_returns_expected_data_sync(self, mock_config):
+    @pytest.mark.parametrize(
+        ("status_code", "expected_error"),
+        [(200, None), (404, NotFoundError)],
+    )
+    def test_get_organization_status_handling_sync(
+        self, mock_config, status_code, expected_error
+    ):
+        res = self._resource(mock_config)
+        payload = (
+            create_organization_response_data()
+            if expected_error is None
+            else {"error": "Organization not found"}
+        )
+        with mock_http_request_sync(payload, status_code=status_code):
+            if expected_error is None:
+                result = res.get()
+                assert isinstance(result, OrganizationGetOrganizationResponse)
+                assert result.org_id == "test-org-123"
+                assert result.org_name == "Test Organization"
+                assert result.title == "Your AI Assistant Platform"
+                assert len(result.onboarding_instructions) == 2
+            else:
+                with pytest.raises(expected_error):
+                    res.get()
+
+    def test_get_organization_serves_repeat_calls_from_cache_sync(self, mock_config):
         res = self._resource(mock_config)
         mock_data = create_organization_response_data()
         with mock_http_request_sync(mock_data):
-            result = res.get()
-            assert isinstance(result, OrganizationGetOrganizationResponse)
-            assert result.org_id == "test-org-123"
-            assert result.org_name == "Test Organization"
-            assert result.title == "Your AI Assistant Platform"
-            assert len(result.onboarding_instructions) == 2
-
-    def test_get_nonexistent_organization_raises_not_found_sync(self, mock_config):
-        res = self._resource(mock_config)
-        with mock_http_request_sync(
-            '{"error": "Organization not found"}', status_code=404
-        ):
-            with pytest.raises(NotFoundError):
-                res.get()
+            first = res.get()
+            second = res.get()
+        assert first is second
 
     def test_get_organization_accepts_missing_optional_branding_fields_sync(
         self, mock_config
@@ -1,8 +1,11 @@
 import pytest
 
-from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import NotFoundError
-from amigo_sdk.generated.model import ServiceGetServicesResponse
+from amigo_sdk.generated.model import (
+    ServiceCreateServiceRequest,
+    ServiceGetServicesResponse,
+    ServiceUpdateServiceRequest,
+)
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
 from amigo_sdk.resources.service import AsyncServiceResource, ServiceResource
 
@@ -12,16 +15,17 @@ from .helpers import (
     mock_http_request_sync,
 )
 
-
-@pytest.fixture
-def mock_config():
-    return AmigoConfig(
-        api_key="test-api-key",
-        api_key_id="test-api-key-id",
-        user_id="test-user-id",
-        organization_id="test-org-123",
-        base_url="https://api.example.com",
-    )
+# Built once: pydantic validates every sub-field on construction, the create
+# tests all send the same payload, and v2 models are immutable by default.
+_CREATE_SERVICE_BODY = ServiceCreateServiceRequest(
+    name="test-svc",
+    description="desc",
+    keyterms=[],
+    tags={},
+    is_active=False,
+    agent_id="aaaaaaaaaaaaaaaaaaaaaaaa",
+    service_hierarchical_state_machine_id="bbbbbbbbbbbbbbbbbbbbbbbb",
+)
 
 
 @pytest.fixture
@@ -35,54 +39,42 @@ class TestServiceResource:
     """Simple test suite for ServiceResource."""
 
     @pytest.mark.asyncio
-    async def test_get_services_returns_expected_data(self, service_resource):
-        """Test get_services method returns properly parsed services data."""
-        mock_data = create_services_response_data()
-
-        async with mock_http_request(mock_data):
-            result = await service_resource.get_services()
-
-            assert isinstance(result, ServiceGetServicesResponse)
-            assert len(result.services) == 2
-            assert result.services[0].id == "service-1"
-            assert result.services[0].name == "Customer Support Bot"
-            assert result.services[1].id == "service-2"
-            assert not result.has_more
-            assert result.continuation_token is None
-
-    @pytest.mark.asyncio
-    async def test_get_services_nonexistent_organization_raises_not_found(
-        self, service_resource
+    @pytest.mark.parametrize(
+        ("status_code", "expected_error"),
+        [(200, None), (404, NotFoundError)],
+    )
+    async def test_get_services_status_handling(
+        self, service_resource, status_code, expected_error
     ):
-        """Test get_services method raises NotFoundError for non-existent organization."""
-        async with mock_http_request(
-            '{"error": "Organization not found"}', status_code=404
-        ):
-            with pytest.raises(NotFoundError):
-                await service_resource.get_services()
+        """get_services parses the happy path and maps 404 to NotFoundError."""
+        payload = (
+            create_services_response_data()
+            if expected_error is None
+            else {"error": "Organization not found"}
+        )
+        async with mock_http_request(payload, status_code=status_code):
+            if expected_error is None:
+                result = await service_resource.get_services()
+                assert isinstance(result, ServiceGetServicesResponse)
+                assert len(result.services) == 2
+                assert result.services[0].id == "service-1"
+                assert result.services[0].name == "Customer Support Bot"
+                assert result.services[1].id == "service-2"
+                assert not result.has_more
+                assert result.continuation_token is None
+            else:
+                with pytest.raises(expected_error):
+                    await service_resource.get_services()
 
     @pytest.mark.asyncio
     async def test_create_service(self, service_resource):
-        from amigo_sdk.generated.model import ServiceCreateServiceRequest
-
         mock_data = {"id": "svc-async-1"}
-        body = ServiceCreateServiceRequest(
-            name="test-svc",
-            description="desc",
-            keyterms=[],
-            tags={},
-            is_active=False,
-            agent_id="aaaaaaaaaaaaaaaaaaaaaaaa",
-            service_hierarchical_state_machine_id="bbbbbbbbbbbbbbbbbbbbbbbb",
-        )
         async with mock_http_request(mock_data):
-            result = await service_resource.create_service(body)
+            result = await service_resource.create_service(_CREATE_SERVICE_BODY)
             assert result.id == "svc-async-1"
 
     @pytest.mark.asyncio
     async def test_update_service(self, service_resource):
-        from amigo_sdk.generated.model import ServiceUpdateServiceRequest
-
         body = ServiceUpdateServiceRequest(is_active=True)
         async with mock_http_request("", status_code=204):
             await service_resource.update_service("svc-1", body)
@@ -101,20 +93,9 @@ class TestServiceResource:
 
     @pytest.mark.asyncio
     async def test_create_alias(self, service_resource):
-        from amigo_sdk.generated.model import ServiceCreateServiceRequest
-
         mock_data = {"id": "svc-alias-1"}
-        body = ServiceCreateServiceRequest(
-            name="test-svc",
-            description="desc",
-            keyterms=[],
-            tags={},
-            is_active=False,
-            agent_id="aaaaaaaaaaaaaaaaaaaaaaaa",
-            service_hierarchical_state_machine_id="bbbbbbbbbbbbbbbbbbbbbbbb",
-        )
         async with mock_http_request(mock_data):
-            result = await service_resource.create(body)
+            result = await service_resource.create(_CREATE_SERVICE_BODY)
             assert result.id == "svc-alias-1"
 
 
@@ -126,46 +107,37 @@ class TestServiceResourceSync:
         http = AmigoHttpClient(mock_config)
         return ServiceResource(http, mock_config.organization_id)
 
-    def test_get_services_returns_expected_data_sync(self, mock_config):
-        res = self._resource(mock_config)
-        mock_data = create_services_response_data()
-        with mock_http_request_sync(mock_data):
-            result = res.get_services()
-            assert isinstance(result, ServiceGetServicesResponse)
-            assert len(result.services) == 2
-            assert result.services[0].id == "service-1"
-
-    def test_get_services_nonexistent_organization_raises_not_found_sync(
-        self, mock_config
+    @pytest.mark.parametrize(
+        ("status_code", "expected_error"),
+        [(200, None), (404, NotFoundError)],
+    )
+    def test_get_services_status_handling_sync(
+        self, mock_config, status_code, expected_error
     ):
         res = self._resource(mock_config)
-        with mock_http_request_sync(
-            '{"error": "Organization not found"}', status_code=404
-        ):
-            with pytest.raises(NotFoundError):
-                res.get_services()
+        payload = (
+            create_services_response_data()
+            if expected_error is None
+            else {"error": "Organization not found"}
+        )
+        with mock_http_request_sync(payload, status_code=status_code):
+            if expected_error is None:
+                result = res.get_services()
+                assert isinstance(result, ServiceGetServicesResponse)
+                assert len(result.services) == 2
+                assert result.services[0].id == "service-1"
+            else:
+                with pytest.raises(expected_error):
+                    res.get_services()
 
     def test_create_service_sync(self, mock_config):
-        from amigo_sdk.generated.model import ServiceCreateServiceRequest
-
         res = self._resource(mock_config)
         mock_data = {"id": "svc-123"}
-        body = ServiceCreateServiceRequest(
-            name="test-svc",
-            description="A test service",
-            keyterms=[],
-            tags={},
-            is_active=False,
-            agent_id="aaaaaaaaaaaaaaaaaaaaaaaa",
-            service_hierarchical_state_machine_id="bbbbbbbbbbbbbbbbbbbbbbbb",
-        )
         with mock_http_request_sync(mock_data):
-            result = res.create_service(body)
+            result = res.create_service(_CREATE_SERVICE_BODY)
             assert result.id == "svc-123"
 
     def test_update_service_sync(self, mock_config):
-        from amigo_sdk.generated.model import ServiceUpdateServiceRequest
-
         res = self._resource(mock_config)
         body = ServiceUpdateServiceRequest(is_active=True)
         with mock_http_request_sync("", status_code=204):
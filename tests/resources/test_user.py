@@ -18,7 +18,7 @@ from amigo_sdk.resources.user import AsyncUserResource, UserResource
 from .helpers import mock_http_request, mock_http_request_sync
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     return AmigoConfig(
         api_key="test-api-key",
@@ -61,7 +61,7 @@ class TestUserResource:
 
     @pytest.mark.asyncio
     async def test_get_users_not_found_raises(self, user_resource):
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await user_resource.get_users()
 
@@ -101,7 +101,7 @@ class TestUserResource:
 
     @pytest.mark.asyncio
     async def test_delete_user_not_found_raises(self, user_resource):
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await user_resource.delete_user("missing")
 
@@ -147,7 +147,7 @@ class TestUserResource:
 
     @pytest.mark.asyncio
     async def test_get_user_model_not_found_raises(self, user_resource):
-        async with mock_http_request("{}", status_code=404):
+        async with mock_http_request({}, status_code=404):
             with pytest.raises(NotFoundError):
                 await user_resource.get_user_model("missing")
 
@@ -181,7 +181,7 @@ class TestUserResourceSync:
 
     def test_get_users_not_found_raises_sync(self, mock_config):
         res = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 res.get_users()
 
@@ -219,7 +219,7 @@ class TestUserResourceSync:
 
     def test_delete_user_not_found_raises_sync(self, mock_config):
         res = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 res.delete_user("missing")
 
@@ -262,6 +262,6 @@ class TestUserResourceSync:
 
     def test_get_user_model_not_found_raises_sync(self, mock_config):
         res = self._resource(mock_config)
-        with mock_http_request_sync("{}", status_code=404):
+        with mock_http_request_sync({}, status_code=404):
             with pytest.raises(NotFoundError):
                 res.get_user_model("missing")
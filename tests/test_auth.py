@@ -1,5 +1,6 @@
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 
+import httpx
 import pytest
 
 from amigo_sdk.auth import sign_in_with_api_key, sign_in_with_api_key_async
@@ -9,7 +10,7 @@ from amigo_sdk.generated.model import UserSignInWithApiKeyResponse
 
 
 # Mock config for testing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     return AmigoConfig(
         api_key="test-api-key",
@@ -20,11 +21,14 @@ def mock_config():
     )
 
 
-# Mock successful auth response
-@pytest.fixture
+# Mock successful auth response; fixed far-future expiry keeps the payload
+# deterministic and avoids a clock read per test.
+_EXPIRES_AT = datetime(2099, 1, 1, tzinfo=UTC).isoformat()
+
+
+@pytest.fixture(scope="module")
 def mock_success_response() -> UserSignInWithApiKeyResponse:
-    expires_at = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
-    return {"id_token": "mock-bearer-token-123", "expires_at": expires_at}
+    return {"id_token": "mock-bearer-token-123", "expires_at": _EXPIRES_AT}
 
 
 @pytest.mark.unit
@@ -55,6 +59,27 @@ class TestAuth:
         assert request.headers["x-api-key-id"] == "test-api-key-id"
         assert request.headers["x-user-id"] == "test-user-id"
 
+    @pytest.mark.asyncio
+    async def test_signin_strips_stale_bearer_from_pooled_client(
+        self, mock_config, mock_success_response, httpx_mock
+    ):
+        """A stale client-default Authorization header must not reach sign-in."""
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/v1/test-org-id/user/signin_with_api_key",
+            json=mock_success_response,
+            status_code=200,
+        )
+
+        async with httpx.AsyncClient(
+            headers={"Authorization": "Bearer expired-token"}
+        ) as client:
+            await sign_in_with_api_key_async(mock_config, client)
+
+        request = httpx_mock.get_request()
+        assert "Authorization" not in request.headers
+        assert request.headers["x-api-key"] == "test-api-key"
+
     @pytest.mark.asyncio
     async def test_non_ok_response_throws_authentication_error(
         self, mock_config, httpx_mock
@@ -129,6 +154,23 @@ class TestAuthSync:
         assert request.headers["x-api-key-id"] == "test-api-key-id"
         assert request.headers["x-user-id"] == "test-user-id"
 
+    def test_signin_strips_stale_bearer_from_pooled_client_sync(
+        self, mock_config, mock_success_response, httpx_mock
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/v1/test-org-id/user/signin_with_api_key",
+            json=mock_success_response,
+            status_code=200,
+        )
+
+        with httpx.Client(headers={"Authorization": "Bearer expired-token"}) as client:
+            sign_in_with_api_key(mock_config, client)
+
+        request = httpx_mock.get_request()
+        assert "Authorization" not in request.headers
+        assert request.headers["x-api-key"] == "test-api-key"
+
     def test_non_ok_response_throws_authentication_error_sync(
         self, mock_config, httpx_mock
     ):
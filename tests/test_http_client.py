@@ -1,9 +1,10 @@
 from datetime import UTC, datetime, timedelta
 from email.utils import format_datetime
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from amigo_sdk.config import AmigoConfig
 from amigo_sdk.errors import (
@@ -14,31 +15,69 @@ from amigo_sdk.errors import (
     ServerError,
 )
 from amigo_sdk.http_client import AmigoAsyncHttpClient, AmigoHttpClient
-from tests.resources.helpers import (
-    mock_http_stream,
-    mock_http_stream_sequence,
-    mock_http_stream_sequence_sync,
-    mock_http_stream_sync,
-)
+
+# Lightweight token stand-ins shared across tests. SimpleNamespace keeps
+# attribute access on the C path and skips Mock's auto-child machinery; the
+# fixed far-future expiry avoids a clock read per test.
+_FRESH_EXPIRY = datetime(2099, 1, 1, tzinfo=UTC)
+_EXPIRED_EXPIRY = datetime(2020, 1, 1, tzinfo=UTC)
+_DEFAULT_TOKEN = SimpleNamespace(id_token="test-bearer-token", expires_at=_FRESH_EXPIRY)
+_EXPIRED_TOKEN = SimpleNamespace(id_token="expired", expires_at=_EXPIRED_EXPIRY)
+
+# Pre-parsed base URL so init assertions use httpx.URL.__eq__ on parsed
+# components instead of formatting the URL back to a string.
+_BASE_URL = httpx.URL("https://api.example.com")
+
+# (initial token state, sign-in outcome, expected id_token or raised error)
+_TOKEN_LIFECYCLE_CASES = [
+    pytest.param(None, "new-token", "new-token", id="fetch"),
+    pytest.param(_EXPIRED_TOKEN, "fresh-token", "fresh-token", id="refresh"),
+    pytest.param(None, Exception("Auth failed"), AuthenticationError, id="failure"),
+]
+
+
+def _token(id_token: str) -> SimpleNamespace:
+    return SimpleNamespace(id_token=id_token, expires_at=_FRESH_EXPIRY)
+
+
+def _assert_retried_once(resp, sleeps, expected_sleep=None):
+    """Assert a request succeeded after exactly one backoff sleep."""
+    assert resp.status_code == 200
+    assert len(sleeps) == 1
+    if expected_sleep is not None:
+        assert sleeps[0] == pytest.approx(expected_sleep, rel=1e-3)
+
+
+def _async_sign_in(token):
+    """Async sign-in replacement returning a fixed token."""
+
+    async def _sign_in(*args, **kwargs):
+        return token
+
+    return _sign_in
+
+
+def _sync_sign_in(token):
+    """Sync sign-in replacement returning a fixed token."""
+
+    def _sign_in(*args, **kwargs):
+        return token
+
+    return _sign_in
 
 
 @pytest.fixture(autouse=True)
-def _autouse_patch_sign_in():
-    fresh_async = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
+def _autouse_patch_sign_in(monkeypatch):
+    # One monkeypatch.setattr per module attribute instead of re-entering
+    # unittest.mock.patch context managers in every test.
+    monkeypatch.setattr(
+        "amigo_sdk.http_client.sign_in_with_api_key_async",
+        _async_sign_in(_DEFAULT_TOKEN),
     )
-    fresh_sync = Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
+    monkeypatch.setattr(
+        "amigo_sdk.http_client.sign_in_with_api_key",
+        _sync_sign_in(_DEFAULT_TOKEN),
     )
-    with (
-        patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_async
-        ),
-        patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh_sync),
-    ):
-        yield
 
 
 @pytest.fixture
@@ -55,15 +94,17 @@ def capture_async_sleeps(monkeypatch):
 @pytest.fixture
 def capture_sync_sleeps(monkeypatch):
     calls: list[float] = []
-
-    def fake_sleep(seconds: float):
-        calls.append(seconds)
-
-    monkeypatch.setattr("time.sleep", fake_sleep)
+    monkeypatch.setattr("time.sleep", calls.append)
     return calls
 
 
 @pytest.fixture
+def max_jitter(monkeypatch):
+    """Pin random.uniform to its upper bound for deterministic backoff."""
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+
+
+@pytest.fixture(scope="session")
 def mock_config():
     return AmigoConfig(
         api_key="test-api-key",
@@ -74,15 +115,26 @@ def mock_config():
     )
 
 
-@pytest.fixture
-def mock_token_response():
-    return Mock(
-        id_token="test-bearer-token",
-        expires_at=datetime.now(UTC) + timedelta(hours=1),
-    )
+# Shared default-config clients for tests that never mutate token state
+# beyond the autouse default sign-in; building an httpx client (and its SSL
+# context) per test is the slowest setup step in this module. Tests that
+# tune retry knobs, swap transports, or assert on refresh behavior still
+# construct their own.
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def shared_async_client(mock_config):
+    client = AmigoAsyncHttpClient(mock_config)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(scope="class")
+def shared_sync_client(mock_config):
+    with AmigoHttpClient(mock_config) as client:
+        yield client
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group("http_client_async")
 class TestAmigoAsyncHttpClient:
     """Test suite for AmigoHttpClient."""
 
@@ -91,76 +143,54 @@ class TestAmigoAsyncHttpClient:
         client = AmigoAsyncHttpClient(mock_config, timeout=30)
         assert client._cfg == mock_config
         assert client._token is None
-        assert client._client.base_url == "https://api.example.com"
+        assert client._client.base_url == _BASE_URL
 
     @pytest.mark.asyncio
-    async def test_ensure_token_fetches_new_token(
-        self, mock_config, mock_token_response
+    @pytest.mark.parametrize(
+        ("initial", "sign_in_outcome", "expected"), _TOKEN_LIFECYCLE_CASES
+    )
+    async def test_ensure_token_lifecycle(
+        self, mock_config, monkeypatch, initial, sign_in_outcome, expected
     ):
-        """Test _ensure_token fetches new token when none exists."""
+        """_ensure_token fetches, refreshes, and maps sign-in failures."""
         client = AmigoAsyncHttpClient(mock_config)
+        client._token = initial
 
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async",
-            return_value=mock_token_response,
-        ):
-            token = await client._ensure_token()
+        if isinstance(sign_in_outcome, Exception):
 
-        assert token == "test-bearer-token"
-        assert client._token == mock_token_response
-
-    @pytest.mark.asyncio
-    async def test_ensure_token_refreshes_expired_token(self, mock_config):
-        """Test _ensure_token refreshes token when expired."""
-        client = AmigoAsyncHttpClient(mock_config)
-
-        # Set an expired token (timezone-aware)
-        expired_token = Mock(
-            id_token="expired-token",
-            expires_at=datetime.now(UTC) - timedelta(minutes=10),  # Expired
+            async def _sign_in(*args, **kwargs):
+                raise sign_in_outcome
+        else:
+            fresh = _token(sign_in_outcome)
+            _sign_in = _async_sign_in(fresh)
+        monkeypatch.setattr(
+            "amigo_sdk.http_client.sign_in_with_api_key_async", _sign_in
         )
-        client._token = expired_token
 
-        fresh_token = Mock(
-            id_token="fresh-token",
-            expires_at=datetime.now(UTC) + timedelta(hours=1),
-        )
-
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
-        ):
+        if isinstance(expected, str):
             token = await client._ensure_token()
-
-        assert token == "fresh-token"
-        assert client._token == fresh_token
-
-    @pytest.mark.asyncio
-    async def test_ensure_token_handles_auth_failure(self, mock_config):
-        """Test _ensure_token raises AuthenticationError when auth fails."""
-        client = AmigoAsyncHttpClient(mock_config)
-
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async",
-            side_effect=Exception("Auth failed"),
-        ):
-            with pytest.raises(AuthenticationError):
+            assert token == expected
+            assert client._token is fresh
+        else:
+            with pytest.raises(expected):
                 await client._ensure_token()
 
     @pytest.mark.asyncio
-    async def test_request_adds_authorization_header(self, mock_config, httpx_mock):
+    async def test_request_adds_authorization_header(
+        self, shared_async_client, httpx_mock
+    ):
         """Test request method adds Authorization header."""
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/test", status_code=200
         )
 
-        client = AmigoAsyncHttpClient(mock_config)
-        await client.request("GET", "/test")
+        await shared_async_client.request("GET", "/test")
 
         request = httpx_mock.get_request()
         assert request.headers["Authorization"] == "Bearer test-bearer-token"
 
     @pytest.mark.asyncio
-    async def test_request_retries_on_401(self, mock_config, httpx_mock):
+    async def test_request_retries_on_401(self, mock_config, httpx_mock, monkeypatch):
         """Test request retries once on 401 response."""
         # First request returns 401, second succeeds
         httpx_mock.add_response(
@@ -175,21 +205,20 @@ class TestAmigoAsyncHttpClient:
 
         client = AmigoAsyncHttpClient(mock_config)
 
-        fresh_token = Mock(
-            id_token="fresh-token",
-            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        monkeypatch.setattr(
+            "amigo_sdk.http_client.sign_in_with_api_key_async",
+            _async_sign_in(_token("fresh-token")),
         )
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
-        ):
-            response = await client.request("GET", "/test")
+        response = await client.request("GET", "/test")
 
         assert response.status_code == 200
         # After 401, token should be refreshed (not None, but fresh)
         assert client._token.id_token == "fresh-token"
 
     @pytest.mark.asyncio
-    async def test_request_raises_error_for_non_2xx(self, mock_config, httpx_mock):
+    async def test_request_raises_error_for_non_2xx(
+        self, shared_async_client, httpx_mock
+    ):
         """Test request raises error for non-2xx responses."""
         httpx_mock.add_response(
             method="GET",
@@ -198,9 +227,8 @@ class TestAmigoAsyncHttpClient:
             text="Bad Request",
         )
 
-        client = AmigoAsyncHttpClient(mock_config)
         with pytest.raises(BadRequestError):
-            await client.request("GET", "/test")
+            await shared_async_client.request("GET", "/test")
 
     @pytest.mark.asyncio
     async def test_async_context_manager(self, mock_config):
@@ -213,82 +241,83 @@ class TestAmigoAsyncHttpClient:
 
     @pytest.mark.asyncio
     async def test_stream_lines_yields_and_sets_headers(self, mock_config):
-        client = AmigoAsyncHttpClient(mock_config)
+        seen: list[httpx.Request] = []
 
-        async with mock_http_stream(
-            [" line1 ", "", "line2\n", " "], status_code=200
-        ) as tracker:
-            lines = []
-            async for ln in client.stream_lines("GET", "/stream-test"):
-                lines.append(ln)
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=b" line1 \n\nline2\n\n \n")
+
+        client = AmigoAsyncHttpClient(
+            mock_config, transport=httpx.MockTransport(handler)
+        )
+        lines = [ln async for ln in client.stream_lines("GET", "/stream-test")]
 
         assert lines == ["line1", "line2"]
-        headers = tracker["last_call"]["headers"]
-        assert headers["Authorization"] == "Bearer test-bearer-token"
-        assert headers["Accept"] == "application/x-ndjson"
+        assert seen[0].headers["Authorization"] == "Bearer test-bearer-token"
+        assert seen[0].headers["Accept"] == "application/x-ndjson"
 
     @pytest.mark.asyncio
     async def test_stream_lines_retries_once_on_401(self, mock_config):
-        client = AmigoAsyncHttpClient(mock_config)
+        statuses = iter([(401, b""), (200, b"ok\n")])
+        calls = {"count": 0}
 
-        async with mock_http_stream_sequence([(401, []), (200, ["ok"])]) as tracker:
-            lines = []
-            async for ln in client.stream_lines("GET", "/retry-401"):
-                lines.append(ln)
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["count"] += 1
+            status, body = next(statuses)
+            return httpx.Response(status, content=body)
 
-        assert tracker["call_count"] == 2
+        client = AmigoAsyncHttpClient(
+            mock_config, transport=httpx.MockTransport(handler)
+        )
+        lines = [ln async for ln in client.stream_lines("GET", "/retry-401")]
+
+        assert calls["count"] == 2
         assert lines == ["ok"]
 
     @pytest.mark.asyncio
     async def test_stream_lines_raises_on_non_2xx(self, mock_config):
-        client = AmigoAsyncHttpClient(mock_config)
-
-        async with mock_http_stream([], status_code=404):
-            with pytest.raises(NotFoundError):
-                async for _ in client.stream_lines("GET", "/not-found"):
-                    pass
-
-    @pytest.mark.asyncio
-    async def test_request_retries_on_5xx_get(
-        self, mock_config, httpx_mock, capture_async_sleeps
-    ):
-        httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r500", status_code=500
-        )
-        httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r500", status_code=200
+        client = AmigoAsyncHttpClient(
+            mock_config,
+            transport=httpx.MockTransport(lambda request: httpx.Response(404)),
         )
-
-        client = AmigoAsyncHttpClient(mock_config, retry_max_attempts=3)
-        resp = await client.request("GET", "/r500")
-
-        assert resp.status_code == 200
-        assert len(capture_async_sleeps) == 1
+        with pytest.raises(NotFoundError):
+            async for _ in client.stream_lines("GET", "/not-found"):
+                pass
 
     @pytest.mark.asyncio
-    async def test_request_retries_on_429_get_respects_retry_after_seconds(
-        self, mock_config, httpx_mock, capture_async_sleeps
+    @pytest.mark.parametrize(
+        ("status", "headers", "expected_sleep"),
+        [
+            (500, {}, None),
+            (429, {"Retry-After": "1.5"}, 1.5),
+        ],
+    )
+    async def test_request_retries_on_retryable_get(
+        self,
+        mock_config,
+        httpx_mock,
+        capture_async_sleeps,
+        status,
+        headers,
+        expected_sleep,
     ):
+        """GET retries once on retryable statuses; Retry-After drives the delay."""
         httpx_mock.add_response(
             method="GET",
-            url="https://api.example.com/r429s",
-            status_code=429,
-            headers={"Retry-After": "1.5"},
+            url="https://api.example.com/retry",
+            status_code=status,
+            headers=headers,
         )
         httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r429s", status_code=200
+            method="GET", url="https://api.example.com/retry", status_code=200
         )
 
         client = AmigoAsyncHttpClient(
-            mock_config,
-            retry_max_attempts=3,
-            retry_max_delay_seconds=10.0,
+            mock_config, retry_max_attempts=3, retry_max_delay_seconds=10.0
         )
-        resp = await client.request("GET", "/r429s")
+        resp = await client.request("GET", "/retry")
 
-        assert resp.status_code == 200
-        assert len(capture_async_sleeps) == 1
-        assert capture_async_sleeps[0] == pytest.approx(1.5, rel=1e-3)
+        _assert_retried_once(resp, capture_async_sleeps, expected_sleep)
 
     @pytest.mark.parametrize(
         "build_headers, expected_seconds",
@@ -333,17 +362,16 @@ class TestAmigoAsyncHttpClient:
         )
 
     def test_request_does_not_retry_post_429_without_retry_after_sync(
-        self, mock_config, httpx_mock
+        self, shared_sync_client, httpx_mock
     ):
         httpx_mock.add_response(
             method="POST", url="https://api.example.com/r429pnora", status_code=429
         )
-        client = AmigoHttpClient(mock_config)
         with pytest.raises(RateLimitError):
-            client.request("POST", "/r429pnora")
+            shared_sync_client.request("POST", "/r429pnora")
 
     def test_request_retries_on_timeout_get_sync(
-        self, mock_config, httpx_mock, capture_sync_sleeps
+        self, shared_sync_client, httpx_mock, capture_sync_sleeps
     ):
         httpx_mock.add_exception(
             method="GET",
@@ -353,25 +381,22 @@ class TestAmigoAsyncHttpClient:
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/timeout", status_code=200
         )
-        client = AmigoHttpClient(mock_config)
-        resp = client.request("GET", "/timeout")
-        assert resp.status_code == 200
-        assert len(capture_sync_sleeps) == 1
+        resp = shared_sync_client.request("GET", "/timeout")
+        _assert_retried_once(resp, capture_sync_sleeps)
 
     def test_request_does_not_retry_post_on_timeout_by_default_sync(
-        self, mock_config, httpx_mock
+        self, shared_sync_client, httpx_mock
     ):
         httpx_mock.add_exception(
             method="POST",
             url="https://api.example.com/timeout-post",
             exception=httpx.ReadTimeout("boom"),
         )
-        client = AmigoHttpClient(mock_config)
         with pytest.raises(httpx.TimeoutException):
-            client.request("POST", "/timeout-post")
+            shared_sync_client.request("POST", "/timeout-post")
 
     def test_backoff_clamps_to_max_delay_sync(
-        self, mock_config, httpx_mock, capture_sync_sleeps
+        self, mock_config, httpx_mock, capture_sync_sleeps, max_jitter
     ):
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/clamp", status_code=500
@@ -382,13 +407,8 @@ class TestAmigoAsyncHttpClient:
         client = AmigoHttpClient(
             mock_config, retry_backoff_base=100.0, retry_max_delay_seconds=0.5
         )
-        with (
-            patch("random.uniform", side_effect=lambda a, b: b),
-        ):
-            resp = client.request("GET", "/clamp")
-        assert resp.status_code == 200
-        assert len(capture_sync_sleeps) == 1
-        assert capture_sync_sleeps[0] == 0.5
+        resp = client.request("GET", "/clamp")
+        _assert_retried_once(resp, capture_sync_sleeps, 0.5)
 
     def test_max_attempts_limits_retries_sync(
         self, mock_config, httpx_mock, capture_sync_sleeps
@@ -454,7 +474,7 @@ class TestAmigoAsyncHttpClient:
 
     @pytest.mark.asyncio
     async def test_request_does_not_retry_post_429_without_retry_after(
-        self, mock_config, httpx_mock
+        self, shared_async_client, httpx_mock, capture_async_sleeps
     ):
         httpx_mock.add_response(
             method="POST",
@@ -462,30 +482,14 @@ class TestAmigoAsyncHttpClient:
             status_code=429,
         )
 
-        client = AmigoAsyncHttpClient(mock_config)
-        fresh_token = Mock(
-            id_token="tok", expires_at=datetime.now(UTC) + timedelta(hours=1)
-        )
-        sleeps: list[float] = []
-
-        async def fake_sleep(seconds: float):
-            sleeps.append(seconds)
-
-        with (
-            patch(
-                "amigo_sdk.http_client.sign_in_with_api_key_async",
-                return_value=fresh_token,
-            ),
-            patch("asyncio.sleep", new=fake_sleep),
-        ):
-            with pytest.raises(RateLimitError):
-                await client.request("POST", "/r429pnora")
+        with pytest.raises(RateLimitError):
+            await shared_async_client.request("POST", "/r429pnora")
 
-        assert sleeps == []
+        assert capture_async_sleeps == []
 
     @pytest.mark.asyncio
     async def test_request_retries_on_timeout_get(
-        self, mock_config, httpx_mock, capture_async_sleeps
+        self, shared_async_client, httpx_mock, capture_async_sleeps
     ):
         httpx_mock.add_exception(
             method="GET",
@@ -496,15 +500,13 @@ class TestAmigoAsyncHttpClient:
             method="GET", url="https://api.example.com/timeout", status_code=200
         )
 
-        client = AmigoAsyncHttpClient(mock_config)
-        resp = await client.request("GET", "/timeout")
+        resp = await shared_async_client.request("GET", "/timeout")
 
-        assert resp.status_code == 200
-        assert len(capture_async_sleeps) == 1
+        _assert_retried_once(resp, capture_async_sleeps)
 
     @pytest.mark.asyncio
     async def test_request_does_not_retry_post_on_timeout_by_default(
-        self, mock_config, httpx_mock
+        self, shared_async_client, httpx_mock
     ):
         httpx_mock.add_exception(
             method="POST",
@@ -512,19 +514,13 @@ class TestAmigoAsyncHttpClient:
             exception=httpx.ReadTimeout("boom"),
         )
 
-        client = AmigoAsyncHttpClient(mock_config)
-        fresh_token = Mock(
-            id_token="tok", expires_at=datetime.now(UTC) + timedelta(hours=1)
-        )
-
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key_async", return_value=fresh_token
-        ):
-            with pytest.raises(httpx.TimeoutException):
-                await client.request("POST", "/timeout-post")
+        with pytest.raises(httpx.TimeoutException):
+            await shared_async_client.request("POST", "/timeout-post")
 
     @pytest.mark.asyncio
-    async def test_backoff_clamps_to_max_delay(self, mock_config, httpx_mock):
+    async def test_backoff_clamps_to_max_delay(
+        self, mock_config, httpx_mock, capture_async_sleeps, max_jitter
+    ):
         # 500 triggers retry with no Retry-After; cap should apply
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/clamp", status_code=500
@@ -533,34 +529,18 @@ class TestAmigoAsyncHttpClient:
             method="GET", url="https://api.example.com/clamp", status_code=200
         )
 
-        # Make base large so window > cap; force uniform to pick window
+        # Make base large so window > cap; max_jitter forces uniform to the cap
         client = AmigoAsyncHttpClient(
             mock_config, retry_backoff_base=100.0, retry_max_delay_seconds=0.5
         )
-        fresh_token = Mock(
-            id_token="tok", expires_at=datetime.now(UTC) + timedelta(hours=1)
-        )
-        sleeps: list[float] = []
+        resp = await client.request("GET", "/clamp")
 
-        async def fake_sleep(seconds: float):
-            sleeps.append(seconds)
-
-        with (
-            patch(
-                "amigo_sdk.http_client.sign_in_with_api_key_async",
-                return_value=fresh_token,
-            ),
-            patch("asyncio.sleep", new=fake_sleep),
-            patch("random.uniform", side_effect=lambda a, b: b),
-        ):
-            resp = await client.request("GET", "/clamp")
-
-        assert resp.status_code == 200
-        assert len(sleeps) == 1
-        assert sleeps[0] == 0.5
+        _assert_retried_once(resp, capture_async_sleeps, 0.5)
 
     @pytest.mark.asyncio
-    async def test_max_attempts_limits_retries(self, mock_config, httpx_mock):
+    async def test_max_attempts_limits_retries(
+        self, mock_config, httpx_mock, capture_async_sleeps
+    ):
         # 3 attempts -> 2 sleeps then final failure
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/max", status_code=500
@@ -573,29 +553,15 @@ class TestAmigoAsyncHttpClient:
         )
 
         client = AmigoAsyncHttpClient(mock_config, retry_max_attempts=3)
-        fresh_token = Mock(
-            id_token="tok", expires_at=datetime.now(UTC) + timedelta(hours=1)
-        )
-        sleeps: list[float] = []
-
-        async def fake_sleep(seconds: float):
-            sleeps.append(seconds)
-
-        with (
-            patch(
-                "amigo_sdk.http_client.sign_in_with_api_key_async",
-                return_value=fresh_token,
-            ),
-            patch("asyncio.sleep", new=fake_sleep),
-        ):
-            with pytest.raises(ServerError):
-                await client.request("GET", "/max")
+        with pytest.raises(ServerError):
+            await client.request("GET", "/max")
 
         # 2 sleeps for 3 attempts
-        assert len(sleeps) == 2
+        assert len(capture_async_sleeps) == 2
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group("http_client_sync")
 class TestAmigoHttpClientSync:
     """Parity tests for the synchronous HTTP client."""
 
@@ -603,54 +569,45 @@ class TestAmigoHttpClientSync:
         client = AmigoHttpClient(mock_config, timeout=30)
         assert client._cfg == mock_config
         assert client._token is None
-        assert client._client.base_url == "https://api.example.com"
+        assert client._client.base_url == _BASE_URL
 
-    def test_ensure_token_fetches_new_token_sync(
-        self, mock_config, mock_token_response
+    @pytest.mark.parametrize(
+        ("initial", "sign_in_outcome", "expected"), _TOKEN_LIFECYCLE_CASES
+    )
+    def test_ensure_token_lifecycle_sync(
+        self, mock_config, monkeypatch, initial, sign_in_outcome, expected
     ):
         client = AmigoHttpClient(mock_config)
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key",
-            return_value=mock_token_response,
-        ):
-            token = client._ensure_token()
-        assert token == "test-bearer-token"
-        assert client._token == mock_token_response
+        client._token = initial
 
-    def test_ensure_token_refreshes_expired_token_sync(self, mock_config):
-        client = AmigoHttpClient(mock_config)
-        expired = Mock(
-            id_token="expired",
-            expires_at=datetime.now(UTC) - timedelta(minutes=10),
-        )
-        client._token = expired
-        fresh = Mock(
-            id_token="fresh",
-            expires_at=datetime.now(UTC) + timedelta(hours=1),
-        )
-        with patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh):
-            token = client._ensure_token()
-        assert token == "fresh"
-        assert client._token == fresh
+        if isinstance(sign_in_outcome, Exception):
 
-    def test_ensure_token_handles_auth_failure_sync(self, mock_config):
-        client = AmigoHttpClient(mock_config)
-        with patch(
-            "amigo_sdk.http_client.sign_in_with_api_key", side_effect=Exception("boom")
-        ):
-            with pytest.raises(AuthenticationError):
+            def _sign_in(*args, **kwargs):
+                raise sign_in_outcome
+        else:
+            fresh = _token(sign_in_outcome)
+            _sign_in = _sync_sign_in(fresh)
+        monkeypatch.setattr("amigo_sdk.http_client.sign_in_with_api_key", _sign_in)
+
+        if isinstance(expected, str):
+            token = client._ensure_token()
+            assert token == expected
+            assert client._token is fresh
+        else:
+            with pytest.raises(expected):
                 client._ensure_token()
 
-    def test_request_adds_authorization_header_sync(self, mock_config, httpx_mock):
+    def test_request_adds_authorization_header_sync(
+        self, shared_sync_client, httpx_mock
+    ):
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/test", status_code=200
         )
-        client = AmigoHttpClient(mock_config)
-        client.request("GET", "/test")
+        shared_sync_client.request("GET", "/test")
         req = httpx_mock.get_request()
         assert req.headers["Authorization"] == "Bearer test-bearer-token"
 
-    def test_request_retries_on_401_sync(self, mock_config, httpx_mock):
+    def test_request_retries_on_401_sync(self, mock_config, httpx_mock, monkeypatch):
         httpx_mock.add_response(
             method="GET", url="https://api.example.com/test", status_code=401
         )
@@ -661,25 +618,25 @@ class TestAmigoHttpClientSync:
             json={"ok": True},
         )
         client = AmigoHttpClient(mock_config)
-        fresh = Mock(
-            id_token="fresh",
-            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        monkeypatch.setattr(
+            "amigo_sdk.http_client.sign_in_with_api_key",
+            _sync_sign_in(_token("fresh")),
         )
-        with patch("amigo_sdk.http_client.sign_in_with_api_key", return_value=fresh):
-            resp = client.request("GET", "/test")
+        resp = client.request("GET", "/test")
         assert resp.status_code == 200
         assert client._token.id_token == "fresh"
 
-    def test_request_raises_error_for_non_2xx_sync(self, mock_config, httpx_mock):
+    def test_request_raises_error_for_non_2xx_sync(
+        self, shared_sync_client, httpx_mock
+    ):
         httpx_mock.add_response(
             method="GET",
             url="https://api.example.com/test",
             status_code=400,
             text="Bad Request",
         )
-        client = AmigoHttpClient(mock_config)
         with pytest.raises(BadRequestError):
-            client.request("GET", "/test")
+            shared_sync_client.request("GET", "/test")
 
     def test_context_manager_sync(self, mock_config):
         with AmigoHttpClient(mock_config) as client:
@@ -687,57 +644,67 @@ class TestAmigoHttpClientSync:
         assert client._client.is_closed
 
     def test_stream_lines_yields_and_sets_headers_sync(self, mock_config):
-        client = AmigoHttpClient(mock_config)
-        with mock_http_stream_sync([" line1 ", "", "line2\n", " "]) as tracker:
-            lines = list(client.stream_lines("GET", "/stream-test"))
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=b" line1 \n\nline2\n\n \n")
+
+        client = AmigoHttpClient(mock_config, transport=httpx.MockTransport(handler))
+        lines = list(client.stream_lines("GET", "/stream-test"))
         assert lines == ["line1", "line2"]
-        headers = tracker["last_call"]["headers"]
-        assert headers["Authorization"] == "Bearer test-bearer-token"
-        assert headers["Accept"] == "application/x-ndjson"
+        assert seen[0].headers["Authorization"] == "Bearer test-bearer-token"
+        assert seen[0].headers["Accept"] == "application/x-ndjson"
 
     def test_stream_lines_retries_once_on_401_sync(self, mock_config):
-        client = AmigoHttpClient(mock_config)
-        with mock_http_stream_sequence_sync([(401, []), (200, ["ok"])]) as tracker:
-            lines = list(client.stream_lines("GET", "/retry-401"))
-        assert tracker["call_count"] == 2
+        statuses = iter([(401, b""), (200, b"ok\n")])
+        calls = {"count": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["count"] += 1
+            status, body = next(statuses)
+            return httpx.Response(status, content=body)
+
+        client = AmigoHttpClient(mock_config, transport=httpx.MockTransport(handler))
+        lines = list(client.stream_lines("GET", "/retry-401"))
+        assert calls["count"] == 2
         assert lines == ["ok"]
 
     def test_stream_lines_raises_on_non_2xx_sync(self, mock_config):
-        client = AmigoHttpClient(mock_config)
-        with mock_http_stream_sync([], status_code=404):
-            with pytest.raises(NotFoundError):
-                list(client.stream_lines("GET", "/not-found"))
-
-    def test_request_retries_on_5xx_get_sync(
-        self, mock_config, httpx_mock, capture_sync_sleeps
-    ):
-        httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r500", status_code=500
-        )
-        httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r500", status_code=200
+        client = AmigoHttpClient(
+            mock_config,
+            transport=httpx.MockTransport(lambda request: httpx.Response(404)),
         )
-        client = AmigoHttpClient(mock_config, retry_max_attempts=3)
-        resp = client.request("GET", "/r500")
-        assert resp.status_code == 200
-        assert len(capture_sync_sleeps) == 1
+        with pytest.raises(NotFoundError):
+            list(client.stream_lines("GET", "/not-found"))
 
-    def test_request_retries_on_429_get_respects_retry_after_seconds_sync(
-        self, mock_config, httpx_mock, capture_sync_sleeps
+    @pytest.mark.parametrize(
+        ("status", "headers", "expected_sleep"),
+        [
+            (500, {}, None),
+            (429, {"Retry-After": "1.5"}, 1.5),
+        ],
+    )
+    def test_request_retries_on_retryable_get_sync(
+        self,
+        mock_config,
+        httpx_mock,
+        capture_sync_sleeps,
+        status,
+        headers,
+        expected_sleep,
     ):
         httpx_mock.add_response(
             method="GET",
-            url="https://api.example.com/r429s",
-            status_code=429,
-            headers={"Retry-After": "1.5"},
+            url="https://api.example.com/retry",
+            status_code=status,
+            headers=headers,
         )
         httpx_mock.add_response(
-            method="GET", url="https://api.example.com/r429s", status_code=200
+            method="GET", url="https://api.example.com/retry", status_code=200
         )
         client = AmigoHttpClient(
             mock_config, retry_max_attempts=3, retry_max_delay_seconds=10.0
         )
-        resp = client.request("GET", "/r429s")
-        assert resp.status_code == 200
-        assert len(capture_sync_sleeps) == 1
-        assert capture_sync_sleeps[0] == pytest.approx(1.5, rel=1e-3)
+        resp = client.request("GET", "/retry")
+        _assert_retried_once(resp, capture_sync_sleeps, expected_sleep)
@@ -11,37 +11,42 @@ from amigo_sdk._retry_utils import (
     parse_retry_after_seconds,
 )
 
+# HTTP-date strings computed once at import instead of per test. Future dates
+# may have drifted into the past by the time a test runs, so those cases only
+# assert a non-negative result (the parser clamps past dates to 0.0).
+_NOW = dt.datetime.now(dt.UTC)
+_FUTURE_HTTP_DATE = format_datetime(_NOW + dt.timedelta(seconds=2))
+_PAST_HTTP_DATE = format_datetime(_NOW - dt.timedelta(seconds=5))
+# RFC 2822 date without timezone, to exercise the tzinfo-None path.
+_NAIVE_FUTURE_HTTP_DATE = (
+    _NOW.replace(tzinfo=None) + dt.timedelta(seconds=2)
+).strftime("%a, %d %b %Y %H:%M:%S")
+
 
 @pytest.mark.unit
 class TestRetryUtils:
-    def test_parse_retry_after_seconds_numeric(self):
-        assert parse_retry_after_seconds("1.5") == pytest.approx(1.5, rel=1e-3)
-
-    def test_parse_retry_after_seconds_http_date(self):
-        future_dt = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=2)
-        http_date = format_datetime(future_dt)
-        sec = parse_retry_after_seconds(http_date)
-        assert sec is not None and sec >= 0
-
-    def test_parse_retry_after_seconds_none_and_empty(self):
-        assert parse_retry_after_seconds(None) is None
-        assert parse_retry_after_seconds("") is None
-
-    def test_parse_retry_after_seconds_invalid(self):
-        assert parse_retry_after_seconds("not-a-date") is None
-
-    def test_parse_retry_after_seconds_negative_numeric_clamped(self):
-        assert parse_retry_after_seconds("-10") == 0.0
-
-    def test_parse_retry_after_seconds_http_date_past_clamped(self):
-        past_dt = dt.datetime.now(dt.UTC) - dt.timedelta(seconds=5)
-        http_date = format_datetime(past_dt)
-        assert parse_retry_after_seconds(http_date) == 0.0
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param("1.5", pytest.approx(1.5, rel=1e-3), id="numeric"),
+            pytest.param("-10", 0.0, id="negative-numeric-clamped"),
+            pytest.param(None, None, id="missing"),
+            pytest.param("", None, id="empty"),
+            pytest.param("not-a-date", None, id="invalid"),
+            pytest.param(_PAST_HTTP_DATE, 0.0, id="http-date-past-clamped"),
+        ],
+    )
+    def test_parse_retry_after_seconds(self, value, expected):
+        assert parse_retry_after_seconds(value) == expected
 
-    def test_parse_retry_after_seconds_http_date_without_tz(self):
-        # Construct RFC 2822 date string without timezone to exercise tzinfo None path
-        future_naive = dt.datetime.utcnow() + dt.timedelta(seconds=2)
-        http_date = future_naive.strftime("%a, %d %b %Y %H:%M:%S")
+    @pytest.mark.parametrize(
+        "http_date",
+        [
+            pytest.param(_FUTURE_HTTP_DATE, id="aware"),
+            pytest.param(_NAIVE_FUTURE_HTTP_DATE, id="naive"),
+        ],
+    )
+    def test_parse_retry_after_seconds_future_http_date(self, http_date):
         sec = parse_retry_after_seconds(http_date)
         assert sec is not None and sec >= 0
 
@@ -81,6 +86,4 @@ class TestRetryUtils:
 
     def test_compute_retry_delay_retry_after_edge_cases_zero(self):
         assert compute_retry_delay_seconds(1, 0.25, 10.0, "-3") == 0.0
-        past_dt = dt.datetime.now(dt.UTC) - dt.timedelta(seconds=10)
-        http_date = format_datetime(past_dt)
-        assert compute_retry_delay_seconds(1, 0.25, 10.0, http_date) == 0.0
+        assert compute_retry_delay_seconds(1, 0.25, 10.0, _PAST_HTTP_DATE) == 0.0
@@ -7,8 +7,17 @@ import pytest
 from amigo_sdk.config import AmigoConfig
 from amigo_sdk.sdk_client import AmigoClient, AsyncAmigoClient
 
+_RESOURCE_NAMES = (
+    "organizations",
+    "agents",
+    "context_graphs",
+    "services",
+    "conversations",
+    "users",
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_config():
     return AmigoConfig(
         api_key="test-api-key",
@@ -62,21 +71,22 @@ class TestAsyncAmigoClient:
                 os.chdir(original_cwd)
 
     def test_resources_are_accessible(self, mock_config):
-        """Test organization and service resources are accessible."""
+        """Test every resource property is wired with an HTTP client."""
         client = AsyncAmigoClient(config=mock_config)
 
-        # Should have resources (basic smoke test)
-        assert client.organizations is not None
-        assert client.services is not None
-        assert hasattr(client.organizations, "_http")
-        assert hasattr(client.services, "_http")
+        for name in _RESOURCE_NAMES:
+            resource = getattr(client, name)
+            assert resource is not None
+            assert hasattr(resource, "_http")
 
     @pytest.mark.asyncio
     async def test_async_context_manager(self, mock_config):
-        """Test client works as async context manager."""
+        """Test client works as async context manager and closes httpx on exit."""
         async with AsyncAmigoClient(config=mock_config) as client:
             assert isinstance(client, AsyncAmigoClient)
             assert client.config == mock_config
+            assert not client._http._client.is_closed
+        assert client._http._client.is_closed
 
 
 @pytest.mark.unit
@@ -118,11 +128,13 @@ class TestAmigoClientSync:
 
     def test_resources_are_accessible_sync(self, mock_config):
         client = AmigoClient(config=mock_config)
-        assert client.organizations is not None
-        assert client.services is not None
-        assert hasattr(client.organizations, "_http")
-        assert hasattr(client.services, "_http")
+        for name in _RESOURCE_NAMES:
+            resource = getattr(client, name)
+            assert resource is not None
+            assert hasattr(resource, "_http")
 
     def test_context_manager_sync(self, mock_config):
         with AmigoClient(config=mock_config) as client:
             assert isinstance(client, AmigoClient)
+            assert not client._http._client.is_closed
+        assert client._http._client.is_closed